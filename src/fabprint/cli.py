@@ -1,5 +1,6 @@
 """CLI entry point for fabprint."""
 
+import dataclasses
 import logging
 import sys
 from pathlib import Path
@@ -422,7 +423,7 @@ def _resolve_status_printers(
     """Build list of (name, creds) tuples for status/watch commands."""
     if printer_name:
         creds = load_creds_fn(printer_name)
-        return [(printer_name, creds)]
+        return [(printer_name, dataclasses.asdict(creds))]
 
     if serial:
         return [(serial, {"type": "bambu-cloud", "serial": serial})]
@@ -13,6 +13,7 @@ import os
 import shutil
 import subprocess
 import tempfile
+import threading
 import time
 from pathlib import Path
 
@@ -33,6 +34,7 @@ BRIDGE_TIMEOUT = 300
 BRIDGE_STATUS_TIMEOUT = 60
 BRIDGE_TASK_LIST_TIMEOUT = 30
 BRIDGE_CANCEL_TIMEOUT = 30
+BRIDGE_READY_TIMEOUT = 60
 
 # Docker pull staleness: only pull if last pull was more than 24h ago.
 # Override with FABPRINT_DOCKER_PULL=always|never|auto (default: auto).
@@ -201,9 +203,16 @@ class PersistentBridge:
             status = bridge.status()
     """
 
-    def __init__(self, token_file: Path, device_id: str = "") -> None:
+    def __init__(
+        self,
+        token_file: Path,
+        device_id: str = "",
+        *,
+        ready_timeout: int = BRIDGE_READY_TIMEOUT,
+    ) -> None:
         self._token_file = token_file.resolve()
         self._device_id = device_id
+        self._ready_timeout = ready_timeout
         self._container_id: str | None = None
         self._proc: subprocess.Popen | None = None
 
@@ -230,18 +239,43 @@ class PersistentBridge:
             stderr=subprocess.PIPE,
             text=True,
         )
-        assert self._proc.stdout is not None
-        # Wait for {"ready":true} signal
-        ready_line = self._proc.stdout.readline().strip()
+        stdout = self._proc.stdout
+        assert stdout is not None
+
+        # Wait for the {"ready":true} signal (sent once the MQTT session is
+        # subscribed). Read it on a helper thread so a bridge that never
+        # connects can't block us forever.
+        lines: list[str] = []
+        got_line = threading.Event()
+
+        def _read_ready() -> None:
+            lines.append(stdout.readline())
+            got_line.set()
+
+        threading.Thread(target=_read_ready, daemon=True).start()
+        if not got_line.wait(timeout=self._ready_timeout):
+            self._kill()
+            raise RuntimeError(f"Bridge watch did not become ready within {self._ready_timeout}s")
+
+        ready_line = lines[0].strip()
         log.debug("Bridge watch ready: %s", ready_line)
         try:
             ready_data = json.loads(ready_line)
-            if not ready_data.get("ready"):
-                raise RuntimeError(f"Bridge watch failed to start: {ready_line}")
         except json.JSONDecodeError:
+            self._kill()
             raise RuntimeError(f"Bridge watch returned non-JSON: {ready_line[:200]}")
+        if not ready_data.get("ready"):
+            self._kill()
+            raise RuntimeError(f"Bridge watch failed to start: {ready_line}")
         return self
 
+    def _kill(self) -> None:
+        """Terminate the watch process without the graceful quit handshake."""
+        if self._proc:
+            self._proc.kill()
+            self._proc.wait()
+            self._proc = None
+
     def __exit__(self, *exc: Any) -> None:
         if self._proc and self._proc.stdin:
             try:
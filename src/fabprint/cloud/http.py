@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from typing import Any
 
 import base64
 import hashlib
 import json
 import logging
+import random
 import time
 import uuid
 from pathlib import Path
@@ -30,6 +32,13 @@ TASK_POLL_INTERVAL = 5
 PROCESSING_POLL_MAX_ATTEMPTS = 15
 PROCESSING_POLL_INTERVAL = 2
 
+# S3 upload retry (exponential backoff with jitter)
+UPLOAD_RETRY_ATTEMPTS = 4
+UPLOAD_RETRY_BASE_DELAY = 0.5
+UPLOAD_RETRY_MAX_DELAY = 4.0
+
+_T = TypeVar("_T")
+
 # BambuConnect X.509 certificate ID and private key for signing print tasks.
 # The server passes this signature to the printer via MQTT; without it the
 # printer rejects the command ("MQTT Command verification failed").
@@ -96,6 +105,31 @@ def _sign_task_body(body_bytes: bytes) -> str:
     return base64.b64encode(signature).decode("ascii")
 
 
+def _with_backoff(
+    fn: Callable[[], _T],
+    *,
+    tries: int = UPLOAD_RETRY_ATTEMPTS,
+    base: float = UPLOAD_RETRY_BASE_DELAY,
+    cap: float = UPLOAD_RETRY_MAX_DELAY,
+) -> _T:
+    """Call *fn*, retrying transient network errors with exponential backoff.
+
+    Only connection failures and timeouts are retried; other request errors
+    (bad URL, invalid header, ...) are permanent and raised at once. The
+    final attempt's error propagates unchanged.
+    """
+    import requests
+
+    for attempt in range(tries - 1):
+        try:
+            return fn()
+        except (requests.ConnectionError, requests.Timeout) as e:
+            delay = min(cap, base * 2**attempt) + random.random() * 0.1
+            log.debug("Transient error (%s), retry %d/%d in %.1fs", e, attempt + 1, tries, delay)
+            time.sleep(delay)
+    return fn()
+
+
 def cloud_list_devices(token_file: Path) -> list[dict]:
     """List bound printers via Bambu Cloud REST API.
 
@@ -291,7 +325,7 @@ def cloud_print_http(
     # but leaves gcode.url EMPTY, causing "MQTT Command verification failed".
     config_3mf_bytes = _strip_gcode_from_3mf(threemf_path)
     log.debug("Uploading config-only 3MF to S3 (%d bytes)", len(config_3mf_bytes))
-    resp = requests.put(upload_url, data=config_3mf_bytes, headers={})
+    resp = _with_backoff(lambda: requests.put(upload_url, data=config_3mf_bytes, headers={}))
     if not resp.ok:
         raise RuntimeError(f"S3 upload failed ({resp.status_code}): {resp.text[:200]}")
     log.debug("Config upload complete")
@@ -340,7 +374,7 @@ def cloud_print_http(
     gcode_bytes = threemf_path.read_bytes()
     gcode_md5 = hashlib.md5(gcode_bytes).hexdigest().upper()
     log.debug("Uploading full 3MF to gcode storage (%d bytes, md5=%s)", len(gcode_bytes), gcode_md5)
-    resp = requests.put(gcode_upload_url, data=gcode_bytes, headers={})
+    resp = _with_backoff(lambda: requests.put(gcode_upload_url, data=gcode_bytes, headers={}))
     if not resp.ok:
         raise RuntimeError(f"Gcode S3 upload failed ({resp.status_code}): {resp.text[:200]}")
     log.debug("Gcode upload complete")
@@ -26,6 +26,7 @@ class SlicerConfig:
     filaments: list[str] = field(default_factory=list)
     slots: dict[int, str] = field(default_factory=dict)  # slot (1-indexed) → profile name
     overrides: dict[str, object] = field(default_factory=dict)
+    cache: bool = False  # reuse finished slices from .fabprint-cache/
 
 
 @dataclass
@@ -210,9 +211,12 @@ def load_config(path: Path) -> FabprintConfig:
         filaments=slicer_raw.get("filaments", []),
         slots=slots_parsed,
         overrides=slicer_raw.get("overrides", {}),
+        cache=slicer_raw.get("cache", False),
     )
     if slicer.engine != "orca":
         raise FabprintError(f"slicer.engine must be 'orca', got '{slicer.engine}'")
+    if not isinstance(slicer.cache, bool):
+        raise FabprintError(f"slicer.cache must be true or false, got {slicer.cache!r}")
 
     # Parts — first pass: parse everything except filament resolution
     parts_raw = raw.get("parts", [])
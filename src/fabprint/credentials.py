@@ -9,15 +9,16 @@ import sys
 import tempfile
 import tomllib
 from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TypedDict
 
 from fabprint import FabprintError
 
 log = logging.getLogger(__name__)
 
 
-class PrinterCredentials(TypedDict):
+@dataclass(frozen=True, slots=True)
+class PrinterCredentials:
     """Credentials for a configured printer."""
 
     type: str | None
@@ -108,7 +109,7 @@ def load_printer_credentials(name: str | None) -> PrinterCredentials:
     2. Named printer entry in credentials.toml
     3. None
 
-    Returns dict with 'type' key indicating printer type.
+    Returns a PrinterCredentials whose ``type`` indicates the printer type.
     """
     file_creds: dict[str, str | None] = {}
 
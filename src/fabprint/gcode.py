@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import contextlib
+import io
+import os
 import re
 import zipfile
+from collections import deque
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import IO
 
 from fabprint import require_file
 
@@ -13,6 +19,81 @@ from fabprint import require_file
 GCODE_HEADER_LINES = 300
 GCODE_TAIL_LINES = 50
 
+# Block size for reading the start/end of large gcode files
+_READ_BLOCK = 65536
+
+# Precompiled metadata patterns (used per line in the header/tail scans).
+# re.ASCII: slicer comments are ASCII, so skip Unicode class lookups.
+# Negated classes ([^;], [^=]) instead of lazy .+? / .*? avoid per-char retries
+_RE_TOTAL_TIME = re.compile(r"total estimated time:\s*([^;]+)", re.ASCII)
+_RE_EST_TIME = re.compile(r";\s*estimated printing time[^=]*=\s*(.+)", re.ASCII)
+# Filament usage labels, matched with startswith rather than a regex
+_USED_G = "filament used [g]"
+_USED_CM3 = "filament used [cm3]"
+_RE_FILAMENT_G_LIST = re.compile(r";\s*filament used \[g\]\s*=\s*(.+)", re.ASCII)
+_RE_FILAMENT_TYPE = re.compile(r";\s*filament_type\s*=\s*(.+)", re.ASCII)
+# Slicer durations like "1d 2h 7m 32s"; every unit is optional
+_RE_DURATION = re.compile(r"(?:(\d+)d\s*)?(?:(\d+)h\s*)?(?:(\d+)m\s*)?(?:(\d+)s)?", re.ASCII)
+_RE_Z_HEIGHT = re.compile(r"; Z_HEIGHT:\s*([\d.]+)", re.ASCII)
+_RE_TOOL_CHANGE = re.compile(r"T(\d+)$", re.ASCII)
+
+
+def _read_head_tail(path: Path, head_lines: int, tail_lines: int) -> tuple[list[str], list[str]]:
+    """Return the first *head_lines* and last *tail_lines* lines of a text file.
+
+    Reads whole blocks from each end only until enough lines are found, so
+    the cost doesn't grow with file size (sliced gcode can be 50MB+).
+    """
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(0)
+        head = b""
+        while head.count(b"\n") < head_lines and len(head) < size:
+            head += f.read(_READ_BLOCK)
+        if len(head) >= size:
+            lines = head.decode(errors="replace").splitlines()
+            return lines[:head_lines], lines[-tail_lines:]
+
+        # Read backwards until we hold more than tail_lines line breaks, so the
+        # (possibly partial) first line can be dropped
+        tail = b""
+        pos = size
+        while tail.count(b"\n") <= tail_lines and pos > 0:
+            step = min(_READ_BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            tail = f.read(step) + tail
+    head_list = head.decode(errors="replace").splitlines()[:head_lines]
+    tail_list = tail.decode(errors="replace").splitlines()
+    if pos > 0:
+        tail_list = tail_list[1:]
+    return head_list, tail_list[-tail_lines:]
+
+
+def _used_value(rest: str) -> float | None:
+    """Parse the number in ``" = 12.34"`` (text following a filament label).
+
+    Multi-slot lists like ``" = 1.5, 2.0"`` yield the first value. Returns
+    None if *rest* isn't an assignment of a number.
+    """
+    rest = rest.lstrip()
+    if not rest.startswith("="):
+        return None
+    value = rest[1:].split(",", 1)[0].strip()
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _duration_secs(text: str) -> int:
+    """Convert a slicer duration like ``"1h 7m 32s"`` to seconds (0 if unparseable)."""
+    m = _RE_DURATION.match(text.strip())
+    if m is None:
+        return 0
+    days, hours, mins, secs = (int(g) if g else 0 for g in m.groups())
+    return days * 86400 + hours * 3600 + mins * 60 + secs
+
 
 def parse_gcode_metadata(gcode_path: Path) -> dict[str, str | float | int]:
     """Extract print time and filament stats from gcode comments.
@@ -24,15 +105,19 @@ def parse_gcode_metadata(gcode_path: Path) -> dict[str, str | float | int]:
     Returns dict with keys like 'print_time', 'print_time_secs',
     'filament_g', and/or 'filament_cm3'.
     """
-    lines = gcode_path.read_text().splitlines()
+    header, tail = _read_head_tail(gcode_path, GCODE_HEADER_LINES, GCODE_TAIL_LINES)
     stats: dict[str, str | float | int] = {}
 
     # Scan header for print time
-    for line in lines[:GCODE_HEADER_LINES]:
-        if m := re.search(r"total estimated time:\s*(.+?)(?:;|$)", line):
-            stats["print_time"] = m.group(1).strip()
-        elif m := re.match(r";\s*estimated printing time.*?=\s*(.+)", line):
+    for line in header:
+        # Cheap literal check first; most header lines are not time comments
+        if "estimated" not in line:
+            continue
+        m = _RE_TOTAL_TIME.search(line) or _RE_EST_TIME.match(line)
+        if m:
+            # First match wins (e.g. normal mode over silent mode)
             stats["print_time"] = m.group(1).strip()
+            break
 
     # Scan tail for filament stats. OrcaSlicer emits one line per slot
     # (including 0.00 for unused slots) and sometimes a separate total line.
@@ -41,15 +126,27 @@ def parse_gcode_metadata(gcode_path: Path) -> dict[str, str | float | int]:
     filament_g_total: float | None = None
     filament_cm3_slots: list[float] = []
     filament_cm3_total: float | None = None
-    for line in lines[-GCODE_TAIL_LINES:]:
-        if m := re.match(r";\s*total filament used \[g\]\s*=\s*([\d.]+)", line):
-            filament_g_total = float(m.group(1))
-        elif m := re.match(r";\s*filament used \[g\]\s*=\s*([\d.]+)", line):
-            filament_g_slots.append(float(m.group(1)))
-        elif m := re.match(r";\s*total filament used \[cm3\]\s*=\s*([\d.]+)", line):
-            filament_cm3_total = float(m.group(1))
-        elif m := re.match(r";\s*filament used \[cm3\]\s*=\s*([\d.]+)", line):
-            filament_cm3_slots.append(float(m.group(1)))
+    for line in tail:
+        if not line.startswith(";") or "filament used" not in line:
+            continue
+        label = line[1:].lstrip()
+        total = label.startswith("total ")
+        if total:
+            label = label[len("total ") :]
+        if label.startswith(_USED_G):
+            value = _used_value(label[len(_USED_G) :])
+            if value is not None and total:
+                filament_g_total = value
+            elif value is not None:
+                filament_g_slots.append(value)
+        elif label.startswith(_USED_CM3):
+            value = _used_value(label[len(_USED_CM3) :])
+            if value is not None and total:
+                filament_cm3_total = value
+            elif value is not None:
+                filament_cm3_slots.append(value)
+        if filament_g_total is not None and filament_cm3_total is not None:
+            break  # totals override any per-slot lines still to come
     g = filament_g_total if filament_g_total is not None else sum(filament_g_slots)
     cm3 = filament_cm3_total if filament_cm3_total is not None else sum(filament_cm3_slots)
     if g > 0:
@@ -59,14 +156,7 @@ def parse_gcode_metadata(gcode_path: Path) -> dict[str, str | float | int]:
 
     # Convert time string like "1h 7m 32s" to seconds
     if "print_time" in stats:
-        t = str(stats["print_time"])
-        secs = 0
-        if hm := re.search(r"(\d+)h", t):
-            secs += int(hm.group(1)) * 3600
-        if mm := re.search(r"(\d+)m", t):
-            secs += int(mm.group(1)) * 60
-        if sm := re.search(r"(\d+)s", t):
-            secs += int(sm.group(1))
+        secs = _duration_secs(str(stats["print_time"]))
         if secs > 0:
             stats["print_time_secs"] = secs
 
@@ -96,19 +186,29 @@ class GcodeInfo:
     print_time: str = ""
 
 
-def read_gcode(path: Path) -> str:
-    """Read gcode from a .gcode file or from inside a .gcode.3mf zip."""
+@contextlib.contextmanager
+def _open_gcode(path: Path) -> Iterator[IO[str]]:
+    """Open gcode as a text stream, from a .gcode file or inside a .gcode.3mf zip."""
     path = Path(path)
     require_file(path, "Gcode file")
 
     if path.suffix == ".3mf" or path.name.endswith(".gcode.3mf"):
         with zipfile.ZipFile(path, "r") as zf:
-            gcode_names = [n for n in zf.namelist() if n.endswith(".gcode")]
-            if not gcode_names:
+            gcode_name = next((n for n in zf.NameToInfo if n.endswith(".gcode")), None)
+            if gcode_name is None:
                 raise ValueError(f"No .gcode file found inside {path}")
-            return zf.read(gcode_names[0]).decode("utf-8", errors="replace")
+            with zf.open(gcode_name) as raw:
+                yield io.TextIOWrapper(raw, encoding="utf-8", errors="replace")
+        return
 
-    return path.read_text()
+    with open(path, encoding="utf-8", errors="replace") as f:
+        yield f
+
+
+def read_gcode(path: Path) -> str:
+    """Read gcode from a .gcode file or from inside a .gcode.3mf zip."""
+    with _open_gcode(path) as f:
+        return f.read()
 
 
 def analyze_gcode(path: Path) -> GcodeInfo:
@@ -116,25 +216,10 @@ def analyze_gcode(path: Path) -> GcodeInfo:
 
     Parses layer boundaries (CHANGE_LAYER), tool changes (T{n}),
     filament types, and per-slot usage from OrcaSlicer/BambuStudio gcode.
+    Lines are streamed, so memory use doesn't grow with file size.
     """
-    text = read_gcode(path)
-    lines = text.splitlines()
     info = GcodeInfo()
 
-    # Parse filament types from header
-    for line in lines[:GCODE_HEADER_LINES]:
-        if m := re.match(r";\s*filament_type\s*=\s*(.+)", line):
-            info.filament_types = [t.strip() for t in m.group(1).split(";")]
-        elif m := re.search(r"total estimated time:\s*(.+?)(?:;|$)", line):
-            info.print_time = m.group(1).strip()
-        elif m := re.match(r";\s*estimated printing time.*?=\s*(.+)", line):
-            info.print_time = m.group(1).strip()
-
-    # Parse per-slot filament usage from tail
-    for line in lines[-GCODE_TAIL_LINES:]:
-        if m := re.match(r";\s*filament used \[g\]\s*=\s*(.+)", line):
-            info.filament_usage_g = [float(v.strip()) for v in m.group(1).split(",")]
-
     # Walk gcode for layers and tool changes.
     # Z_HEIGHT appears immediately after CHANGE_LAYER, so we track
     # per-layer z values and resolve spans at the end.
@@ -146,27 +231,48 @@ def analyze_gcode(path: Path) -> GcodeInfo:
     # (layer, extruder) pairs recording each tool change point
     tool_events: list[tuple[int, int]] = []  # (layer_at_change, new_extruder)
 
-    for line in lines:
-        if line.startswith("; CHANGE_LAYER"):
-            current_layer += 1
-        elif m := re.match(r"; Z_HEIGHT:\s*([\d.]+)", line):
-            current_z = float(m.group(1))
-            layer_z[current_layer] = current_z
-        elif m := re.match(r"T(\d+)$", line):
-            tool = int(m.group(1))
-            # Skip special tool numbers (T1000 = initial load, T255 = unload)
-            if tool >= 255:
-                continue
-            if current_layer == 0:
-                # Pre-print tool select — set initial extruder, not a change
-                current_extruder = tool
-            elif tool != current_extruder:
-                if not tool_events:
-                    # Record initial extruder span starting at layer 1
-                    tool_events.append((1, current_extruder))
-                tool_events.append((current_layer, tool))
-                info.filament_changes += 1
-                current_extruder = tool
+    # Last GCODE_TAIL_LINES lines, for per-slot filament usage
+    tail: deque[str] = deque(maxlen=GCODE_TAIL_LINES)
+
+    with _open_gcode(path) as f:
+        for lineno, raw_line in enumerate(f):
+            line = raw_line.rstrip("\r\n")
+            tail.append(line)
+            # Parse filament types from header
+            if lineno < GCODE_HEADER_LINES:
+                if m := _RE_FILAMENT_TYPE.match(line):
+                    info.filament_types = [t.strip() for t in m.group(1).split(";")]
+                elif not info.print_time and (
+                    m := _RE_TOTAL_TIME.search(line) or _RE_EST_TIME.match(line)
+                ):
+                    # First estimate wins, as in parse_gcode_metadata
+                    info.print_time = m.group(1).strip()
+
+            if line.startswith("; CHANGE_LAYER"):
+                current_layer += 1
+            elif m := _RE_Z_HEIGHT.match(line):
+                current_z = float(m.group(1))
+                layer_z[current_layer] = current_z
+            elif m := _RE_TOOL_CHANGE.match(line):
+                tool = int(m.group(1))
+                # Skip special tool numbers (T1000 = initial load, T255 = unload)
+                if tool >= 255:
+                    continue
+                if current_layer == 0:
+                    # Pre-print tool select — set initial extruder, not a change
+                    current_extruder = tool
+                elif tool != current_extruder:
+                    if not tool_events:
+                        # Record initial extruder span starting at layer 1
+                        tool_events.append((1, current_extruder))
+                    tool_events.append((current_layer, tool))
+                    info.filament_changes += 1
+                    current_extruder = tool
+
+    # Parse per-slot filament usage from tail
+    for line in tail:
+        if m := _RE_FILAMENT_G_LIST.match(line):
+            info.filament_usage_g = [float(v.strip()) for v in m.group(1).split(",")]
 
     # If no tool events recorded, the initial extruder was used throughout
     if not tool_events and current_layer > 0:
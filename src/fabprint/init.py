@@ -95,9 +95,9 @@ def _check_profile_type(name: str, engine: str, category: str) -> str | None:
     """
     import json
 
-    from fabprint.profiles import SYSTEM_DIRS
+    from fabprint.profiles import system_dir
 
-    base = SYSTEM_DIRS.get(engine)
+    base = system_dir(engine)
     if not base:
         return None
     path = base / category / f"{name}.json"
@@ -18,6 +18,14 @@ MESH_EXTENSIONS = {".stl", ".3mf"}
 STEP_EXTENSIONS = {".step", ".stp"}
 SUPPORTED_EXTENSIONS = MESH_EXTENSIONS | STEP_EXTENSIONS
 
+# Namespaced 3MF element tags, built once rather than per lookup
+_TAG_OBJECT = f"{{{NS_3MF}}}object"
+_TAG_MESH = f"{{{NS_3MF}}}mesh"
+_TAG_VERTEX = f"{{{NS_3MF}}}vertex"
+_TAG_TRIANGLE = f"{{{NS_3MF}}}triangle"
+_TAG_BUILD = f"{{{NS_3MF}}}build"
+_TAG_ITEM = f"{{{NS_3MF}}}item"
+
 
 def load_mesh(path: Path) -> trimesh.Trimesh:
     """Load a mesh file and return a single trimesh.Trimesh."""
@@ -64,11 +72,12 @@ def extract_paint_colors(path: Path) -> list[str] | None:
     try:
         with zipfile.ZipFile(path, "r") as zf:
             # Collect all model XML files (root + sub-objects)
+            # NameToInfo is the archive's own name -> ZipInfo dict; no list copy
             model_files = []
-            if "3D/3dmodel.model" in zf.namelist():
+            if "3D/3dmodel.model" in zf.NameToInfo:
                 model_files.append("3D/3dmodel.model")
             model_files.extend(
-                n for n in zf.namelist() if n.startswith("3D/Objects/") and n.endswith(".model")
+                n for n in zf.NameToInfo if n.startswith("3D/Objects/") and n.endswith(".model")
             )
             if not model_files:
                 return None
@@ -77,7 +86,7 @@ def extract_paint_colors(path: Path) -> list[str] | None:
             has_paint = False
             for mf in model_files:
                 root = ET.fromstring(zf.read(mf))
-                for tri in root.iter(f"{{{NS_3MF}}}triangle"):
+                for tri in root.iter(_TAG_TRIANGLE):
                     pc = tri.get("paint_color")
                     if pc is not None:
                         has_paint = True
@@ -107,34 +116,35 @@ def load_3mf_objects(path: Path) -> list[tuple[str, trimesh.Trimesh]]:
         model_xml = zf.read("3D/3dmodel.model")
 
     root = ET.fromstring(model_xml)
-    ns = NS_3MF
 
     # Parse all objects by id
     obj_map: dict[str, tuple[str, trimesh.Trimesh]] = {}
-    for obj_elem in root.findall(f".//{{{ns}}}object"):
+    for obj_elem in root.iter(_TAG_OBJECT):
         obj_id = obj_elem.get("id")
         name = obj_elem.get("name", f"object_{obj_id}")
 
-        mesh_elem = obj_elem.find(f"{{{ns}}}mesh")
+        mesh_elem = obj_elem.find(_TAG_MESH)
         if mesh_elem is None:
             continue
 
-        vertices = []
-        for v in mesh_elem.findall(f".//{{{ns}}}vertex"):
-            vertices.append([float(v.get("x")), float(v.get("y")), float(v.get("z"))])
-
-        faces = []
-        for t in mesh_elem.findall(f".//{{{ns}}}triangle"):
-            faces.append([int(t.get("v1")), int(t.get("v2")), int(t.get("v3"))])
+        # iter() streams elements instead of building findall() lists
+        vertices = [
+            [float(v.get("x")), float(v.get("y")), float(v.get("z"))]
+            for v in mesh_elem.iter(_TAG_VERTEX)
+        ]
+        faces = [
+            [int(t.get("v1")), int(t.get("v2")), int(t.get("v3"))]
+            for t in mesh_elem.iter(_TAG_TRIANGLE)
+        ]
 
         mesh = trimesh.Trimesh(vertices=vertices, faces=faces)
         obj_map[obj_id] = (name, mesh)
 
     # Walk build items, applying transforms if present
     results = []
-    build = root.find(f"{{{ns}}}build")
+    build = root.find(_TAG_BUILD)
     if build is not None:
-        for item in build.findall(f"{{{ns}}}item"):
+        for item in build.findall(_TAG_ITEM):
             obj_id = item.get("objectid")
             if obj_id not in obj_map:
                 continue
@@ -17,6 +17,9 @@ from fabprint.constants import NS_3MF
 
 log = logging.getLogger(__name__)
 
+# XML declaration followed by the opening <model ...> tag (captured)
+_RE_MODEL_OPEN = re.compile(r"<\?xml[^?]*\?>\s*(<model[^>]*>)")
+
 
 def _encode_paint_color(extruder_idx: int) -> str:
     """Encode a 0-based extruder index as a paint_color hex string.
@@ -201,8 +204,8 @@ def _inject_paint_data(output: Path, scene: trimesh.Scene) -> None:
     # Restore the original opening tag (with all xmlns:* attrs) so
     # OrcaSlicer doesn't crash on missing namespaces.
     orig_str = model_xml.decode("utf-8")
-    orig_open = re.match(r"<\?xml[^?]*\?>\s*(<model[^>]*>)", orig_str)
-    new_open = re.match(r"<\?xml[^?]*\?>\s*(<model[^>]*>)", new_xml)
+    orig_open = _RE_MODEL_OPEN.match(orig_str)
+    new_open = _RE_MODEL_OPEN.match(new_xml)
     if orig_open and new_open:
         new_xml = new_xml.replace(new_open.group(1), orig_open.group(1), 1)
 
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import copy
+import functools
+import hashlib
 import json
 import logging
+import os
 import subprocess
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from urllib.error import URLError
-from urllib.request import urlopen
 
 from fabprint import FabprintError
 
@@ -18,25 +22,25 @@ log = logging.getLogger(__name__)
 CATEGORIES = ("machine", "process", "filament")
 
 
-def _system_dirs() -> dict[str, Path]:
-    """Return slicer system profile directories for the current platform."""
+ENGINES = ("orca",)
+
+_HOME = Path.home()
+
+
+@functools.cache
+def system_dir(engine: str) -> Path | None:
+    """Return the slicer system profile directory for *engine* on this platform.
+
+    Returns None for unknown engines. Computed on first use and cached.
+    """
+    if engine not in ENGINES:
+        return None
     if sys.platform == "darwin":
-        return {
-            "orca": Path.home() / "Library/Application Support/OrcaSlicer/system/BBL",
-        }
+        return _HOME / "Library/Application Support/OrcaSlicer/system/BBL"
     elif sys.platform == "win32":
-        appdata = Path.home() / "AppData/Roaming"
-        return {
-            "orca": appdata / "OrcaSlicer/system/BBL",
-        }
+        return _HOME / "AppData/Roaming/OrcaSlicer/system/BBL"
     else:  # Linux and other Unix
-        config = Path.home() / ".config"
-        return {
-            "orca": config / "OrcaSlicer/system/BBL",
-        }
-
-
-SYSTEM_DIRS = _system_dirs()
+        return _HOME / ".config/OrcaSlicer/system/BBL"
 
 
 def _is_path(value: str) -> bool:
@@ -44,14 +48,86 @@ def _is_path(value: str) -> bool:
     return "/" in value or "\\" in value
 
 
+# Scan results from discover_profiles, keyed by each category dir's mtime
+_PROFILE_CACHE_PATH = _HOME / ".cache" / "fabprint" / "profiles.json"
+# Serialises read-modify-write of the cache file; discover_profiles is
+# called from worker threads (pin_profiles, filament resolution)
+_PROFILE_CACHE_LOCK = threading.Lock()
+
+
+def _category_mtimes(base: Path) -> dict[str, int]:
+    """Return st_mtime_ns for each existing category directory under *base*."""
+    mtimes: dict[str, int] = {}
+    for category in CATEGORIES:
+        try:
+            mtimes[category] = (base / category).stat().st_mtime_ns
+        except OSError:
+            continue
+    return mtimes
+
+
+def _load_profile_cache(base: Path, mtimes: dict[str, int]) -> dict[str, dict[str, Path]] | None:
+    """Return cached discover_profiles results for *base* if its dirs are unchanged."""
+    try:
+        cache = json.loads(_PROFILE_CACHE_PATH.read_text())
+        entry = cache[str(base)]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if entry.get("mtimes") != mtimes:
+        return None
+    profiles = entry.get("profiles", {})
+    return {cat: {name: Path(p) for name, p in profiles.get(cat, {}).items()} for cat in CATEGORIES}
+
+
+def _save_profile_cache(
+    base: Path, mtimes: dict[str, int], result: dict[str, dict[str, Path]]
+) -> None:
+    """Record discover_profiles results for *base* (best-effort).
+
+    The file is replaced atomically, so concurrent readers (including other
+    processes) never see a torn write.
+    """
+    entry = {
+        "mtimes": mtimes,
+        "profiles": {
+            cat: {name: str(p) for name, p in profiles.items()} for cat, profiles in result.items()
+        },
+    }
+    with _PROFILE_CACHE_LOCK:
+        try:
+            cache = json.loads(_PROFILE_CACHE_PATH.read_text())
+            if not isinstance(cache, dict):
+                cache = {}
+        except (OSError, ValueError):
+            cache = {}
+        cache[str(base)] = entry
+        try:
+            _PROFILE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            _write_profile_json(_PROFILE_CACHE_PATH, cache)
+        except OSError:
+            pass  # caching is an optimisation; never break discovery
+
+
 def discover_profiles(engine: str) -> dict[str, dict[str, Path]]:
     """Scan system directories for available profiles.
 
+    Results are cached in ``~/.cache/fabprint/profiles.json`` and reused
+    while the category directories' mtimes are unchanged. Adding, removing
+    or renaming a profile updates its directory's mtime; editing a file in
+    place (e.g. changing its "type") does not, so delete the cache file to
+    pick up such an edit.
+
     Returns {"machine": {"Name": Path, ...}, "process": {...}, "filament": {...}}
     """
-    base = SYSTEM_DIRS.get(engine)
+    base = system_dir(engine)
     if base is None:
-        raise ValueError(f"Unknown engine: '{engine}'. Supported: {list(SYSTEM_DIRS)}")
+        raise ValueError(f"Unknown engine: '{engine}'. Supported: {list(ENGINES)}")
+
+    mtimes = _category_mtimes(base)
+    if mtimes:
+        cached = _load_profile_cache(base, mtimes)
+        if cached is not None:
+            return cached
 
     # Expected JSON "type" field for each category.
     # machine_model profiles (e.g. "Bambu Lab P1S") define the printer
@@ -85,6 +161,8 @@ def discover_profiles(engine: str) -> dict[str, dict[str, Path]]:
                 profiles[name] = f
         result[category] = profiles
 
+    if mtimes:
+        _save_profile_cache(base, mtimes, result)
     return result
 
 
@@ -309,7 +387,7 @@ def resolve_profile(
             return local
 
     # Check system directory
-    base = SYSTEM_DIRS.get(engine)
+    base = system_dir(engine)
     if base:
         system = base / category / f"{name_or_path}.json"
         if system.exists():
@@ -322,6 +400,90 @@ def resolve_profile(
     )
 
 
+# Flattened resolve_profile_data results, one file per resolved profile path
+_RESOLVED_CACHE_DIR = _HOME / ".cache" / "fabprint" / "resolved"
+
+
+def _file_signature(path: Path) -> list[int] | None:
+    """Return [mtime_ns, size] for *path*, or None if it doesn't exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+# In-process copy of resolved cache entries, so repeat resolutions within one
+# run (e.g. slicing several plates) skip re-reading and parsing the cache file
+_RESOLVED_MEMO: dict[Path, tuple[dict, dict]] = {}
+
+# Parsed profile JSON by path, with the [mtime_ns, size] it was read at. Leaf
+# profiles share parents (e.g. fdm_filament_common), so resolving several
+# profiles on a cold cache parses each shared parent once
+_PROFILE_JSON_MEMO: dict[str, tuple[list[int], dict]] = {}
+
+
+def _read_profile_json(path: Path) -> tuple[dict, list[int]]:
+    """Parse the profile JSON at *path*, reusing the last parse if unchanged.
+
+    Returns (data, [mtime_ns, size]); raises FileNotFoundError if missing.
+    The dict is shared between callers and must not be mutated.
+    """
+    st = path.stat()
+    signature = [st.st_mtime_ns, st.st_size]
+    memo = _PROFILE_JSON_MEMO.get(str(path))
+    if memo is not None and memo[0] == signature:
+        return memo[1], signature
+    with open(path) as f:
+        data = json.load(f)
+    _PROFILE_JSON_MEMO[str(path)] = (signature, data)
+    return data, signature
+
+
+def _load_resolved_cache(cache_file: Path) -> dict | None:
+    """Return cached flattened profile data if none of its source files changed."""
+    entry = _RESOLVED_MEMO.get(cache_file)
+    if entry is None:
+        try:
+            raw = json.loads(cache_file.read_text())
+            entry = (raw["deps"], raw["data"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if not isinstance(entry[0], dict) or not isinstance(entry[1], dict):
+            return None
+    deps, data = entry
+    for dep, signature in deps.items():
+        if _file_signature(Path(dep)) != signature:
+            _RESOLVED_MEMO.pop(cache_file, None)
+            return None
+    _RESOLVED_MEMO[cache_file] = entry
+    # Deep copy: list values (e.g. per-filament arrays) would otherwise be
+    # shared with the memoized entry
+    return copy.deepcopy(data)
+
+
+def _save_resolved_cache(cache_file: Path, deps: dict[str, list[int] | None], data: dict) -> None:
+    """Record flattened profile data with its source file signatures (best-effort).
+
+    *data* is kept as the memoized entry, so it must not be mutated afterwards.
+    """
+    _RESOLVED_MEMO[cache_file] = (deps, data)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        try:
+            # dumps + one write: json.dump streams through the slower
+            # pure-Python encoder in many small chunks
+            with os.fdopen(fd, "w") as fh:
+                fh.write(json.dumps({"deps": deps, "data": data}))
+            os.replace(tmp, cache_file)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    except OSError:
+        pass  # caching is an optimisation; never break resolution
+
+
 def resolve_profile_data(
     name_or_path: str,
     engine: str,
@@ -332,39 +494,80 @@ def resolve_profile_data(
 
     Returns a merged dict with all inherited values resolved,
     with the 'inherits' key removed so the slicer uses it as-is.
+
+    Results are cached under ~/.cache/fabprint/resolved, keyed by the
+    resolved profile path and invalidated when any file in the chain (or
+    a missing candidate parent) changes. Each call returns an independent
+    (deep) copy, so callers may modify it freely.
     """
     path = resolve_profile(name_or_path, engine, category, project_dir)
-    base = SYSTEM_DIRS.get(engine)
-
-    chain = []
+    base = system_dir(engine)
+
+    key = hashlib.blake2b(f"{category}\0{path}\0{base}".encode(), digest_size=16).hexdigest()
+    cache_file = _RESOLVED_CACHE_DIR / f"{key}.json"
+    cached = _load_resolved_cache(cache_file)
+    if cached is not None:
+        return cached
+
+    leaf, signature = _read_profile_json(path)
+    chain = [leaf]
+    # Every file whose presence or content affects the result
+    deps: dict[str, list[int] | None] = {str(path): signature}
     current = path
-    seen: set[str] = set()
-    while current:
-        if str(current) in seen:
+    seen = {str(path)}
+    while parent_name := chain[-1].get("inherits"):
+        # Check sibling directory first, then system dir. Stat candidates
+        # directly rather than exists() + stat() to save a syscall per level.
+        candidates = [current.parent / f"{parent_name}.json"]
+        if base:
+            candidates.append(base / category / f"{parent_name}.json")
+        parent: dict | None = None
+        for candidate in candidates:
+            if str(candidate) in seen:
+                break  # inheritance cycle
+            try:
+                parent, deps[str(candidate)] = _read_profile_json(candidate)
+            except FileNotFoundError:
+                deps[str(candidate)] = None
+                continue
             break
-        seen.add(str(current))
-        with open(current) as f:
-            data = json.load(f)
-        chain.append(data)
-        parent_name = data.get("inherits")
-        if not parent_name:
-            break
-        # Check sibling directory first, then system dir
-        sibling = current.parent / f"{parent_name}.json"
-        system = (base / category / f"{parent_name}.json") if base else None
-        if sibling.exists():
-            current = sibling
-        elif system and system.exists():
-            current = system
-        else:
+        if parent is None:
             break
+        seen.add(str(candidate))
+        chain.append(parent)
+        current = candidate
 
     # Merge root-first so leaf values override parents
     merged: dict = {}
     for data in reversed(chain):
         merged.update(data)
     merged.pop("inherits", None)
-    return merged
+    # merged shares list values with the parsed files in _PROFILE_JSON_MEMO;
+    # the memo keeps it and the caller gets a copy
+    _save_resolved_cache(cache_file, deps, merged)
+    return copy.deepcopy(merged)
+
+
+# Upper bound on threads used to resolve and write pinned profiles
+_PIN_MAX_WORKERS = 8
+
+
+def _write_profile_json(dest: Path, data: dict) -> None:
+    """Write profile JSON to *dest* atomically.
+
+    Profiles pinned concurrently may read each other as inheritance parents,
+    so readers must never see a partially written file.
+    """
+    # A plain open() (not mkstemp, which creates 0600) so pinned files get
+    # the usual umask-derived mode; they're meant to be committed and shared
+    tmp = dest.with_name(f".{dest.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "w") as fh:
+            json.dump(data, fh, indent=4)
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def pin_profiles(
@@ -395,25 +598,37 @@ def pin_profiles(
     for f in filaments:
         items.append(("filament", f))
 
-    # Try local resolution first; collect failures for Docker fallback
-    docker_needed: list[tuple[str, str]] = []
+    local_items: list[tuple[str, str]] = []
     for category, name in items:
         if _is_path(name):
             log.info("Skipping '%s' (already a path)", name)
-            continue
+        else:
+            local_items.append((category, name))
 
+    def _pin_local(item: tuple[str, str]) -> Path | None:
+        category, name = item
         dest_dir = project_dir / "profiles" / category
         dest_dir.mkdir(parents=True, exist_ok=True)
         dest = dest_dir / f"{name}.json"
-
         try:
             data = resolve_profile_data(name, engine, category, project_dir)
-            with open(dest, "w") as fh:
-                json.dump(data, fh, indent=4)
-            log.info("Pinned %s → %s (flattened)", name, dest)
-            pinned.append(dest)
         except FileNotFoundError:
-            docker_needed.append((category, name))
+            return None
+        _write_profile_json(dest, data)
+        log.info("Pinned %s → %s (flattened)", name, dest)
+        return dest
+
+    # Try local resolution first (I/O-bound, so resolve items concurrently);
+    # collect failures for Docker fallback
+    docker_needed: list[tuple[str, str]] = []
+    if local_items:
+        with ThreadPoolExecutor(max_workers=min(_PIN_MAX_WORKERS, len(local_items))) as ex:
+            results = list(ex.map(_pin_local, local_items))
+        for item, dest in zip(local_items, results):
+            if dest is None:
+                docker_needed.append(item)
+            else:
+                pinned.append(dest)
 
     # Docker fallback for profiles not found locally
     if docker_needed:
@@ -434,8 +649,7 @@ def pin_profiles(
                 dest = dest_dir / f"{name}.json"
 
                 data = _resolve_profile_data_from_dir(name, category, docker_dir)
-                with open(dest, "w") as fh:
-                    json.dump(data, fh, indent=4)
+                _write_profile_json(dest, data)
                 log.info("Pinned %s → %s (from Docker, flattened)", name, dest)
                 pinned.append(dest)
         finally:
@@ -486,10 +700,13 @@ def add_profile(
     """
     # Load the JSON from source
     if source.startswith(("http://", "https://")):
+        # urllib.request is slow to import; only pay for it when downloading
+        from urllib.request import urlopen
+
         try:
             with urlopen(source, timeout=30) as resp:  # noqa: S310
                 raw = resp.read()
-        except (URLError, OSError) as e:
+        except OSError as e:  # includes URLError
             raise FabprintError(f"Failed to download profile from {source}: {e}") from e
         try:
             data = json.loads(raw)
@@ -2,14 +2,27 @@
 
 from __future__ import annotations
 
+import atexit
+import contextlib
+import copy
+import functools
+import hashlib
+import io
 import json
 import logging
+import os
 import re
 import shutil
+import struct
 import subprocess
 import sys
+import tarfile
 import tempfile
+import threading
 import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 from fabprint import FabprintError, require_file
@@ -21,6 +34,14 @@ log = logging.getLogger(__name__)
 
 DOCKERHUB_REPO = "fabprint/fabprint"
 
+# Where profile JSON is unpacked inside the slicer container. The image runs
+# as the non-root "fabprint" user and /work is root-owned (Docker creates it
+# for the bind mounts), so this must live somewhere that user can write
+_DOCKER_PROFILE_DIR = "/tmp/fabprint-profiles"
+
+# Chunk size for streaming zip member data (hashing, raw copies)
+_ZIP_COPY_BLOCK = 1 << 20
+
 
 def _slicer_paths() -> dict[str, Path]:
     """Return default slicer executable paths for the current platform."""
@@ -41,6 +62,9 @@ def _slicer_paths() -> dict[str, Path]:
 
 SLICER_PATHS = _slicer_paths()
 
+# Executable names searched on PATH when the default install path is missing
+_SLICER_PATH_NAMES = {"orca": ("orca-slicer", "OrcaSlicer", "OrcaSlicer.AppImage")}
+
 
 def _docker_image(version: str | None = None) -> str:
     """Return the Docker image name for a given OrcaSlicer version."""
@@ -49,21 +73,33 @@ def _docker_image(version: str | None = None) -> str:
     return f"{DOCKERHUB_REPO}:latest"
 
 
+@functools.lru_cache(maxsize=4)
 def find_slicer(engine: str) -> Path:
     """Find the slicer executable for the given engine.
 
-    Checks the platform-specific default path first, then falls back
-    to searching PATH (useful on Linux or custom installs).
+    An explicit FABPRINT_<ENGINE>_PATH environment variable (e.g.
+    FABPRINT_ORCA_PATH) wins. Otherwise the platform-specific default path
+    is checked, then PATH is searched (useful on Linux or custom installs).
+    Successful lookups are cached for the life of the process.
     """
     if engine not in SLICER_PATHS:
         raise ValueError(f"Unknown slicer engine: '{engine}'. Supported: {list(SLICER_PATHS)}")
 
+    env_var = f"FABPRINT_{engine.upper()}_PATH"
+    if override := os.environ.get(env_var):
+        env_path = Path(override)
+        if not env_path.is_file():
+            raise FileNotFoundError(f"{env_var} points to {env_path}, which is not a file")
+        return env_path
+
+    # is_file() rather than exists(): same single stat, but a leftover
+    # directory at the default path (e.g. a half-removed .app) isn't a match
     path = SLICER_PATHS[engine]
-    if path.exists():
+    if path.is_file():
         return path
 
     # Fall back to PATH lookup (handles AppImage, Flatpak, AUR, custom installs)
-    for name in ("orca-slicer", "OrcaSlicer", "OrcaSlicer.AppImage"):
+    for name in _SLICER_PATH_NAMES[engine]:
         found = shutil.which(name)
         if found:
             return Path(found)
@@ -71,47 +107,121 @@ def find_slicer(engine: str) -> Path:
     raise FileNotFoundError(f"OrcaSlicer not found at {path} or on PATH. Is OrcaSlicer installed?")
 
 
-def _write_tmp_profile(data: dict, tmp_dir: Path, name: str) -> Path:
-    """Write a profile dict to a JSON file in the given temp directory."""
-    path = tmp_dir / f"{name}.json"
-    path.write_text(json.dumps(data, indent=4))
-    return path
+_PROFILE_BUNDLE_DIR: Path | None = None
+_PROFILE_BUNDLE_LOCK = threading.Lock()
+
+
+def _profile_bundle_dir() -> Path:
+    """Return this process's temp dir for flattened slicer profiles.
+
+    Created on first use and removed at exit, so a batch of slices shares
+    one directory and identical profiles are written only once.
+    """
+    global _PROFILE_BUNDLE_DIR
+    with _PROFILE_BUNDLE_LOCK:  # slice_plates may call this from several threads
+        if _PROFILE_BUNDLE_DIR is None or not _PROFILE_BUNDLE_DIR.is_dir():
+            _PROFILE_BUNDLE_DIR = Path(tempfile.mkdtemp(prefix="fabprint_"))
+            atexit.register(shutil.rmtree, _PROFILE_BUNDLE_DIR, ignore_errors=True)
+        return _PROFILE_BUNDLE_DIR
+
+
+def _write_tmp_profiles(profiles: dict[str, dict], tmp_dir: Path) -> dict[str, Path]:
+    """Write profile dicts to JSON files in the given temp directory.
+
+    *profiles* maps file stem to data. Files are named by content hash
+    (``<stem>-<hash>.json``) and skipped if already present, so repeat
+    slices with the same profiles reuse earlier files. New files are
+    written with raw fd writes and renamed into place atomically.
+    Returns {stem: path}.
+    """
+    # Compact separators: the slicer doesn't need pretty-printed input.
+    # Indent only when debugging, so the files are readable
+    dump_args: dict = {"separators": (",", ":")}
+    if log.isEnabledFor(logging.DEBUG):
+        dump_args = {"indent": 4}
+    paths: dict[str, Path] = {}
+    for name, data in profiles.items():
+        payload = json.dumps(data, **dump_args).encode()
+        digest = hashlib.blake2b(payload, digest_size=8).hexdigest()
+        path = tmp_dir / f"{name}-{digest}.json"
+        paths[name] = path
+        if path.exists():
+            continue
+        tmp = tmp_dir / f".{path.name}.{threading.get_ident()}.tmp"
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    return paths
 
 
 def _apply_overrides(data: dict, overrides: dict[str, object], name: str) -> dict:
-    """Apply overrides to resolved profile data, returning the modified dict."""
-    applied = []
-    for key, value in overrides.items():
-        old = data.get(key, "<unset>")
-        # Slicer profiles store all values as strings
-        data[key] = str(value)
-        applied.append(f"  {key}: {old} → {value}")
-
-    log.info(
-        "Applied %d override(s) to %s:\n%s",
-        len(applied),
-        name,
-        "\n".join(applied),
-    )
-    return data
+    """Return a copy of resolved profile data with overrides applied.
+
+    *data* is left untouched so the flattened (cacheable) profile stays
+    independent of per-run overrides.
+    """
+    # Slicer profiles store all values as strings
+    merged = {**data, **{key: str(value) for key, value in overrides.items()}}
+
+    if log.isEnabledFor(logging.INFO):
+        applied = [
+            f"  {key}: {data.get(key, '<unset>')} → {value}" for key, value in overrides.items()
+        ]
+        log.info(
+            "Applied %d override(s) to %s:\n%s",
+            len(applied),
+            name,
+            "\n".join(applied),
+        )
+    return merged
 
 
+# OrcaSlicer prints e.g. "OrcaSlicer-2.3.1:" near the top of --help
+_RE_SLICER_VERSION = re.compile(r"OrcaSlicer[- ](\d[^\s:]+)", re.ASCII)
+
+# Lines of --help output scanned for the version
+_VERSION_PROBE_LINES = 5
+
+
+@functools.lru_cache(maxsize=4)
 def _detect_slicer_version(slicer: Path) -> str | None:
-    """Detect the version of a local slicer by parsing --help output."""
+    """Detect the version of a local slicer by parsing --help output.
+
+    Launching the slicer costs seconds, so the result is cached per path.
+    Only the first few lines are read; the process is killed as soon as
+    the version is found rather than waiting for the full help text.
+    """
     try:
-        r = subprocess.run(
+        proc = subprocess.Popen(
             [str(slicer), "--help"],
-            capture_output=True,
-            text=True,
-            timeout=10,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
         )
-        # OrcaSlicer prints "OrcaSlicer-2.3.1:" on the first few lines
-        for line in (r.stdout + r.stderr).splitlines()[:5]:
-            m = re.search(r"OrcaSlicer[- ]([\d][^\s:]+)", line)
+    except FileNotFoundError:
+        return None
+    assert proc.stdout is not None
+    # readline() blocks, so enforce the timeout by killing the process
+    timer = threading.Timer(10, proc.kill)
+    timer.start()
+    try:
+        for _ in range(_VERSION_PROBE_LINES):
+            line = proc.stdout.readline()
+            if not line:
+                break
+            m = _RE_SLICER_VERSION.search(line.decode(errors="replace"))
             if m:
                 return m.group(1)
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        pass
+    finally:
+        timer.cancel()
+        proc.kill()
+        proc.stdout.close()
+        proc.wait()
     return None
 
 
@@ -131,17 +241,27 @@ def _check_slicer_version(
         )
 
 
+# Images already confirmed present locally. Only positive results are kept so
+# a later pull (or a freshly started Docker daemon) is still noticed.
+_DOCKER_IMAGES_PRESENT: set[str] = set()
+
+
 def _has_docker_image(image: str) -> bool:
     """Check if the given Docker image exists locally."""
+    if image in _DOCKER_IMAGES_PRESENT:
+        return True
     try:
         r = subprocess.run(
             ["docker", "image", "inspect", image],
             capture_output=True,
             timeout=10,
         )
-        return r.returncode == 0
     except (FileNotFoundError, subprocess.TimeoutExpired):
         return False
+    if r.returncode != 0:
+        return False
+    _DOCKER_IMAGES_PRESENT.add(image)
+    return True
 
 
 def _pull_docker_image(image: str) -> bool:
@@ -155,6 +275,7 @@ def _pull_docker_image(image: str) -> bool:
             timeout=300,
         )
         if r.returncode == 0:
+            _DOCKER_IMAGES_PRESENT.add(image)
             return True
         log.debug("docker pull failed: %s", r.stderr.strip())
     except (FileNotFoundError, subprocess.TimeoutExpired):
@@ -162,13 +283,83 @@ def _pull_docker_image(image: str) -> bool:
     return False
 
 
+@functools.cache
+def _docker_cli_available() -> bool:
+    """Return True if the docker CLI is on PATH (checked once per process)."""
+    return shutil.which("docker") is not None
+
+
 def _ensure_docker_image(image: str) -> bool:
     """Ensure a Docker image is available locally, pulling if needed."""
+    if not _docker_cli_available():
+        return False  # skip spawning inspect + pull just to hit FileNotFoundError
     if _has_docker_image(image):
         return True
     return _pull_docker_image(image)
 
 
+# Lines of slicer stderr kept for error reporting
+_STDERR_TAIL_LINES = 200
+
+
+def _run_slicer(
+    cmd: list[str], timeout: float, label: str, input: bytes | None = None
+) -> tuple[int, str]:
+    """Run a slicer command, streaming its output to the log as it arrives.
+
+    stdout lines are logged at INFO and stderr lines at DEBUG; only the last
+    _STDERR_TAIL_LINES lines of stderr are kept, so memory stays flat
+    however chatty the slicer is. When INFO is disabled, stdout goes straight
+    to /dev/null rather than through a pipe nobody logs.
+    Returns (returncode, stderr_tail). Raises subprocess.TimeoutExpired
+    (after killing the process) if it runs longer than *timeout* seconds.
+    """
+    log_stdout = log.isEnabledFor(logging.INFO)
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE if input is not None else None,
+        stdout=subprocess.PIPE if log_stdout else subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    stderr_tail: deque[str] = deque(maxlen=_STDERR_TAIL_LINES)
+
+    def _drain_stdout() -> None:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            log.info("%s: %s", label, line.decode(errors="replace").rstrip())
+
+    def _drain_stderr() -> None:
+        assert proc.stderr is not None
+        for line in proc.stderr:
+            text = line.decode(errors="replace").rstrip("\n")
+            stderr_tail.append(text)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("%s stderr: %s", label, text)
+
+    targets = (_drain_stdout, _drain_stderr) if log_stdout else (_drain_stderr,)
+    drainers = [threading.Thread(target=fn, daemon=True) for fn in targets]
+    for t in drainers:
+        t.start()
+    try:
+        if input is not None:
+            assert proc.stdin is not None
+            try:
+                proc.stdin.write(input)
+            except BrokenPipeError:
+                pass  # exited early; the return code tells the story
+            finally:
+                proc.stdin.close()
+        returncode = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        for t in drainers:
+            t.join()
+    return returncode, "\n".join(stderr_tail)
+
+
 def _slice_via_docker(
     input_3mf: Path,
     output_dir: Path,
@@ -179,22 +370,39 @@ def _slice_via_docker(
 ) -> Path:
     """Run the slicer inside the fabprint Docker container.
 
-    Profile files live under output_dir/.profiles/ so they're accessible
-    via the same volume mount as the output directory. No separate mount
-    needed (avoids macOS Docker temp-dir visibility issues).
-    """
-    input_3mf = input_3mf.resolve()
-    output_dir = output_dir.resolve()
-    output_dir.mkdir(parents=True, exist_ok=True)
+    Profile files are streamed into the container as an in-memory tar on
+    stdin and unpacked to _DOCKER_PROFILE_DIR before the slicer starts, so they
+    need no volume mount (avoids macOS Docker temp-dir visibility issues
+    and VirtioFS writes to the output dir).
 
-    # Profile dir is under output_dir, so rewrite paths relative to /work/output
-    host_prefix = str(profile_dir)
-    container_prefix = "/work/output/" + profile_dir.name
+    *input_3mf* and *output_dir* must be absolute (Docker bind mounts), and
+    *output_dir* must exist; slice_plate has already resolved and created them.
+    """
+    # Only send the profiles this slice references; profile_dir is shared.
+    # Args are "<_DOCKER_PROFILE_DIR>/<name>" strings, so split off the name
+    names = {
+        p.rpartition("/")[2]
+        for arg in (settings_arg, filament_arg)
+        if arg
+        for p in arg.split(";")
+        if p
+    }
+    # Build entries by hand: tar.add() stats each file and looks up its
+    # owner/group names, none of which the container needs
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tar:
+        for name in sorted(names):
+            data = (profile_dir / name).read_bytes()
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mode = 0o644
+            tar.addfile(info, io.BytesIO(data))
 
     cmd = [
         "docker",
         "run",
         "--rm",
+        "-i",
         "--platform",
         "linux/amd64",
         "-v",
@@ -202,16 +410,18 @@ def _slice_via_docker(
         "-v",
         f"{output_dir}:/work/output",
         "--entrypoint",
-        "orca-slicer",
+        "sh",
         image,
+        "-c",
+        f'mkdir -p {_DOCKER_PROFILE_DIR} && tar -xf - -C {_DOCKER_PROFILE_DIR} && exec "$0" "$@"',
+        "orca-slicer",
     ]
 
+    # Profile args already point at _DOCKER_PROFILE_DIR (see _resolve_profiles)
     if settings_arg:
-        rewritten = settings_arg.replace(host_prefix, container_prefix)
-        cmd.extend(["--load-settings", rewritten])
+        cmd.extend(["--load-settings", settings_arg])
     if filament_arg:
-        rewritten = filament_arg.replace(host_prefix, container_prefix)
-        cmd.extend(["--load-filaments", rewritten])
+        cmd.extend(["--load-filaments", filament_arg])
 
     sliced_3mf_name = input_3mf.stem + "_sliced.gcode.3mf"
     cmd.extend(
@@ -227,21 +437,45 @@ def _slice_via_docker(
         ]
     )
 
-    log.info("Slicing via Docker (%s): %s", image, " ".join(cmd))
+    if log.isEnabledFor(logging.INFO):
+        log.info("Slicing via Docker (%s): %s", image, " ".join(cmd))
 
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+    returncode, stderr = _run_slicer(cmd, 600, "Docker slicer", input=buf.getvalue())
 
-    if result.returncode != 0:
-        log.error("Docker slicer stderr:\n%s", result.stderr)
-        raise RuntimeError(
-            f"Docker slicer failed (exit code {result.returncode}):\n{result.stderr[:500]}"
-        )
+    if returncode != 0:
+        log.error("Docker slicer stderr:\n%s", stderr)
+        raise RuntimeError(f"Docker slicer failed (exit code {returncode}):\n{stderr[-500:]}")
 
-    log.info("Docker slicer stdout:\n%s", result.stdout)
     log.info("Slicing complete. Output in %s", output_dir)
     return output_dir
 
 
+def _prefetch_profiles(
+    engine: str,
+    printer: str | None,
+    process: str | None,
+    filaments: list[str] | None,
+    project_dir: Path | None,
+) -> None:
+    """Warm the resolved-profile cache for the given profile names.
+
+    Errors are ignored here; _resolve_profiles hits and reports them.
+    """
+    wanted = [(printer, "machine"), (process, "process")]
+    wanted += [(f, "filament") for f in dict.fromkeys(filaments or [])]
+    for name, category in wanted:
+        if not name:
+            continue
+        try:
+            resolve_profile_data(name, engine, category, project_dir)
+        except Exception:
+            log.debug("Profile prefetch failed for %s", name, exc_info=True)
+
+
+# Upper bound on threads used to resolve filament profiles
+_RESOLVE_MAX_WORKERS = 8
+
+
 def _resolve_profiles(
     engine: str,
     printer: str | None,
@@ -250,13 +484,17 @@ def _resolve_profiles(
     overrides: dict[str, object] | None,
     project_dir: Path | None,
     tmp_dir: Path,
+    path_prefix: str | None = None,
 ) -> tuple[str | None, str | None]:
     """Resolve and flatten all profiles into tmp_dir.
 
     Returns (settings_arg, filament_arg) — semicolon-separated paths
-    suitable for --load-settings and --load-filaments.
+    suitable for --load-settings and --load-filaments. If *path_prefix*
+    is given, the returned paths use it in place of tmp_dir (e.g. where
+    the files appear inside the Docker container).
     """
-    settings = []
+    # File stem -> flattened data, written together once everything resolves
+    pending: dict[str, dict] = {}
     if printer:
         data = resolve_profile_data(printer, engine, "machine", project_dir)
         # Validate: machine_model profiles define the printer but can't be sliced
@@ -266,30 +504,47 @@ def _resolve_profiles(
                 f"not a slicer profile. Use the nozzle-specific variant instead, "
                 f"e.g. '{printer} 0.4 nozzle'"
             )
-        path = _write_tmp_profile(data, tmp_dir, "machine")
-        settings.append(str(path))
+        pending["machine"] = data
     if process:
         data = resolve_profile_data(process, engine, "process", project_dir)
         if overrides:
             data = _apply_overrides(data, overrides, process)
-        path = _write_tmp_profile(data, tmp_dir, "process")
-        settings.append(str(path))
+        pending["process"] = data
+
+    # Resolve each distinct filament concurrently (I/O-bound file reads)
+    names = list(dict.fromkeys(f for f in filaments or [] if f))
+    by_name: dict[str, dict] = {}
+    if names:
+        with ThreadPoolExecutor(max_workers=min(_RESOLVE_MAX_WORKERS, len(names))) as pool:
+            resolved_data = pool.map(
+                lambda name: resolve_profile_data(name, engine, "filament", project_dir), names
+            )
+            by_name = dict(zip(names, resolved_data))
+
+    # Each distinct filament is written once, named after its first slot.
+    # Gap (empty) slots map to None
+    stems: dict[str, str] = {}
+    filament_slots: list[str | None] = []
+    for i, f in enumerate(filaments or []):
+        if f:
+            if f not in stems:
+                stems[f] = f"filament_{i}"
+                pending[stems[f]] = by_name[f]
+            filament_slots.append(stems[f])
+        else:
+            filament_slots.append(None)
+
+    paths = {
+        name: f"{path_prefix}/{path.name}" if path_prefix else str(path)
+        for name, path in _write_tmp_profiles(pending, tmp_dir).items()
+    }
+    settings = [paths[name] for name in ("machine", "process") if name in paths]
 
     filament_arg = None
     if filaments:
-        resolved = []
-        # Resolve real profiles; reuse the first for gap (empty) slots
-        first_path: str | None = None
-        for i, f in enumerate(filaments):
-            if f:
-                data = resolve_profile_data(f, engine, "filament", project_dir)
-                path = _write_tmp_profile(data, tmp_dir, f"filament_{i}")
-                resolved.append(str(path))
-                if first_path is None:
-                    first_path = str(path)
-            else:
-                resolved.append("")
+        resolved = [paths[slot] if slot else "" for slot in filament_slots]
         # Fill gap slots with the first resolved profile (same file, no re-resolve)
+        first_path = next((p for p in resolved if p), None)
         if first_path:
             resolved = [p if p else first_path for p in resolved]
         filament_arg = ";".join(resolved)
@@ -319,6 +574,96 @@ _BC_DEFAULT_KEYS: dict[str, object] = {
 _MIN_FILAMENT_SLOTS = 5
 
 
+# Fixed-size part of a zip local file header (name and extra field follow)
+_ZIP_LOCAL_HEADER_SIZE = 30
+
+
+# Plate metadata keys Bambu Connect requires in model_settings.config.
+# Thumbnail/bbox references are needed even if the files don't exist.
+_BC_PLATE_METADATA = {
+    "thumbnail_file": "Metadata/plate_1.png",
+    "thumbnail_no_light_file": "Metadata/plate_no_light_1.png",
+    "top_file": "Metadata/top_1.png",
+    "pick_file": "Metadata/pick_1.png",
+    "pattern_bbox_file": "Metadata/plate_1.json",
+}
+
+# Metadata key names, and the two spots model_settings.config is patched at
+_RE_MS_KEY = re.compile(r'key="([^"]*)"')
+_RE_MS_PATCH = re.compile(r'key="filament_maps" value="([^"]*)"|  </plate>')
+
+
+def _copy_zip_member_raw(
+    zin: zipfile.ZipFile, zout: zipfile.ZipFile, info: zipfile.ZipInfo
+) -> None:
+    """Copy a zip member's compressed bytes into *zout* without recompressing.
+
+    zipfile has no public API for this, so read the payload from after the
+    member's local header and append it the way ZipFile.writestr does. The
+    embedded gcode can be tens of MB, so skipping inflate+deflate matters.
+    """
+    src, dst = zin.fp, zout.fp
+    if src is None or dst is None:
+        raise ValueError("Cannot copy zip member between closed archives")
+    src.seek(info.header_offset)
+    header = src.read(_ZIP_LOCAL_HEADER_SIZE)
+    name_len, extra_len = struct.unpack("<HH", header[26:30])
+    src.seek(info.header_offset + _ZIP_LOCAL_HEADER_SIZE + name_len + extra_len)
+
+    out = copy.copy(info)
+    out.flag_bits &= ~0x08  # CRC and sizes go in the local header, no data descriptor
+    out.header_offset = dst.tell()
+    dst.write(out.FileHeader())
+    # Stream the payload in bounded chunks rather than holding it all
+    remaining = info.compress_size
+    while remaining:
+        chunk = src.read(min(_ZIP_COPY_BLOCK, remaining))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Truncated zip member {info.filename}")
+        dst.write(chunk)
+        remaining -= len(chunk)
+    zout.filelist.append(out)
+    zout.NameToInfo[out.filename] = out
+    zout.start_dir = dst.tell()
+
+
+def _patch_project_settings(ps_raw: bytes) -> bytes | None:
+    """Add missing Bambu Connect keys and pad short arrays in project_settings.
+
+    Returns None if nothing needs changing. When only keys are missing they
+    are spliced in before the closing brace, so the (often 100+ KB) config
+    isn't re-serialized; padding arrays still needs a full dump.
+    """
+    ps = json.loads(ps_raw)
+    # List defaults are padded like any other filament array
+    missing = {
+        key: [*default, *default[-1:] * (_MIN_FILAMENT_SLOTS - len(default))]
+        if isinstance(default, list)
+        else default
+        for key, default in _BC_DEFAULT_KEYS.items()
+        if key not in ps
+    }
+    short = [
+        val for val in ps.values() if isinstance(val, list) and 0 < len(val) < _MIN_FILAMENT_SLOTS
+    ]
+    if not short:
+        if not missing:
+            return None
+        end = ps_raw.rindex(b"}")
+        body = ps_raw[:end].rstrip()
+        sep = b"" if body.endswith(b"{") else b","
+        fragments = b",".join(
+            f"\n    {json.dumps(key)}: {json.dumps(val)}".encode() for key, val in missing.items()
+        )
+        return body + sep + fragments + b"\n" + ps_raw[end:]
+
+    ps.update(missing)
+    for val in short:
+        while len(val) < _MIN_FILAMENT_SLOTS:
+            val.append(val[-1])
+    return json.dumps(ps, indent=4).encode()
+
+
 def _fix_sliced_3mf(path: Path, plate_3mf: Path | None = None) -> None:
     """Post-process a --min-save 3mf so Bambu Connect accepts it.
 
@@ -327,27 +672,19 @@ def _fix_sliced_3mf(path: Path, plate_3mf: Path | None = None) -> None:
     2. model_settings.config — filament_maps padding + thumbnail references
     3. Thumbnail PNGs — add placeholder images
     """
-    import io
-    import re as _re
-
-    if not path.exists():
+    try:
+        zin = zipfile.ZipFile(path, "r")
+    except FileNotFoundError:
         return
 
-    with zipfile.ZipFile(path, "r") as zin:
+    with zin:
         try:
             ps_raw = zin.read("Metadata/project_settings.config")
         except KeyError:
             return  # No project_settings — nothing to fix
 
         # --- Fix project_settings.config ---
-        ps = json.loads(ps_raw)
-        for key, default in _BC_DEFAULT_KEYS.items():
-            if key not in ps:
-                ps[key] = default
-        for key, val in ps.items():
-            if isinstance(val, list) and 0 < len(val) < _MIN_FILAMENT_SLOTS:
-                while len(val) < _MIN_FILAMENT_SLOTS:
-                    val.append(val[-1])
+        ps_patched = _patch_project_settings(ps_raw)
 
         # --- Fix model_settings.config ---
         try:
@@ -357,35 +694,27 @@ def _fix_sliced_3mf(path: Path, plate_3mf: Path | None = None) -> None:
 
         ms_patched = None
         if ms_raw:
-            # Pad filament_maps value (e.g. "1" -> "1 1 1 1 1")
-            def _pad_filament_maps(m: _re.Match) -> str:
-                val = m.group(1)
-                parts = val.split()
+            # Metadata keys Bambu Connect requires that are missing
+            present = set(_RE_MS_KEY.findall(ms_raw))
+            missing = "".join(
+                f'    <metadata key="{key}" value="{val}"/>\n'
+                for key, val in _BC_PLATE_METADATA.items()
+                if key not in present
+            )
+
+            # One pass: pad filament_maps (e.g. "1" -> "1 1 1 1 1") and
+            # insert the missing keys before each </plate>
+            def _patch(m: re.Match) -> str:
+                if m.group(1) is None:
+                    return missing + m.group(0)
+                parts = m.group(1).split()
                 while len(parts) < _MIN_FILAMENT_SLOTS:
                     parts.append(parts[-1] if parts else "1")
                 return f'key="filament_maps" value="{" ".join(parts)}"'
 
-            ms_patched = _re.sub(
-                r'key="filament_maps" value="([^"]*)"',
-                _pad_filament_maps,
-                ms_raw,
-            )
-
-            # Add missing metadata keys that Bambu Connect requires.
-            # Thumbnail/bbox references are needed even if files don't exist.
-            extra_keys = {
-                "thumbnail_file": "Metadata/plate_1.png",
-                "thumbnail_no_light_file": "Metadata/plate_no_light_1.png",
-                "top_file": "Metadata/top_1.png",
-                "pick_file": "Metadata/pick_1.png",
-                "pattern_bbox_file": "Metadata/plate_1.json",
-            }
-            for key, val in extra_keys.items():
-                if f'key="{key}"' not in ms_patched:
-                    ms_patched = ms_patched.replace(
-                        "  </plate>",
-                        f'    <metadata key="{key}" value="{val}"/>\n  </plate>',
-                    )
+            ms_patched = _RE_MS_PATCH.sub(_patch, ms_raw)
+            if ms_patched == ms_raw:
+                ms_patched = None
 
         # Check if OrcaSlicer generated valid thumbnails (requires Xvfb).
         # A valid PNG is > 1KB; broken headless ones are empty or tiny.
@@ -398,12 +727,19 @@ def _fix_sliced_3mf(path: Path, plate_3mf: Path | None = None) -> None:
         }
         for fname, (w, h) in thumb_files.items():
             try:
-                existing = zin.read(fname)
-                if len(existing) >= _THUMB_MIN_SIZE:
-                    continue  # OrcaSlicer generated a valid thumbnail
+                info = zin.getinfo(fname)
             except KeyError:
-                pass
-            thumbnail_overrides[fname] = generate_plate_thumbnail(w, h, plate_3mf)
+                info = None
+            if info is not None and info.file_size >= _THUMB_MIN_SIZE:
+                continue  # OrcaSlicer generated a valid thumbnail
+            thumbnail = generate_plate_thumbnail(w, h, plate_3mf)
+            # Placeholders are small too; skip ones already written by an earlier pass
+            if info is None or zin.read(info) != thumbnail:
+                thumbnail_overrides[fname] = thumbnail
+
+        if ps_patched is None and ms_patched is None and not thumbnail_overrides:
+            log.info("Sliced 3mf already Bambu Connect compatible, skipping patch")
+            return
 
         # Rewrite the zip
         buf = io.BytesIO()
@@ -411,21 +747,129 @@ def _fix_sliced_3mf(path: Path, plate_3mf: Path | None = None) -> None:
             for item in zin.infolist():
                 if item.filename in thumbnail_overrides:
                     pass  # replaced below
-                elif item.filename == "Metadata/project_settings.config":
-                    zout.writestr(item, json.dumps(ps, indent=4))
+                elif item.filename == "Metadata/project_settings.config" and ps_patched:
+                    zout.writestr(item, ps_patched)
                 elif item.filename == "Metadata/model_settings.config" and ms_patched:
                     zout.writestr(item, ms_patched)
                 else:
-                    zout.writestr(item, zin.read(item.filename))
+                    _copy_zip_member_raw(zin, zout, item)
 
-            # Always write generated thumbnails (replace OrcaSlicer's broken ones)
+            # Always write generated thumbnails (replace OrcaSlicer's broken ones).
+            # PNG data is already deflated, so store it as-is
             for fname, data in thumbnail_overrides.items():
-                zout.writestr(fname, data)
+                zout.writestr(fname, data, compress_type=zipfile.ZIP_STORED)
 
     path.write_bytes(buf.getvalue())
     log.info("Patched sliced 3mf for Bambu Connect compatibility")
 
 
+# Per-output-tree cache of finished slices, keyed by input and profile content
+_SLICE_CACHE_DIRNAME = ".fabprint-cache"
+
+
+def _plate_digest(input_3mf: Path) -> hashlib.blake2b:
+    """Hash the member names and contents of *input_3mf*.
+
+    The zip container itself isn't hashed: export_plate stamps the current
+    time into each member header, so re-exporting an unchanged plate would
+    otherwise always miss. Non-zip inputs are hashed as raw bytes.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        zf = zipfile.ZipFile(input_3mf)
+    except zipfile.BadZipFile:
+        with open(input_3mf, "rb") as f:
+            while chunk := f.read(_ZIP_COPY_BLOCK):
+                digest.update(chunk)
+        return digest
+    with zf:
+        for info in zf.infolist():
+            digest.update(f"{info.filename}\0{info.file_size}\0".encode())
+            with zf.open(info) as member:
+                while chunk := member.read(_ZIP_COPY_BLOCK):
+                    digest.update(chunk)
+    return digest
+
+
+def _profile_arg_names(arg: str | None) -> str | None:
+    """Reduce a ;-separated profile arg to its file names.
+
+    The names carry each flattened profile's content hash (see
+    _write_tmp_profiles), while the directories are per-process temp dirs.
+    """
+    if arg is None:
+        return None
+    return ";".join(os.path.basename(p) for p in arg.split(";"))
+
+
+def _slice_cache_dir(
+    output_dir: Path,
+    input_3mf: Path,
+    settings_arg: str | None,
+    filament_arg: str | None,
+    *parts: object,
+) -> Path:
+    """Return the cache entry dir for slicing *input_3mf* with the given settings.
+
+    *parts* identify everything else that affects the output (slicer,
+    filament ids). Profiles are keyed by their content-hashed file names.
+    """
+    digest = _plate_digest(input_3mf)
+    profiles = (_profile_arg_names(settings_arg), _profile_arg_names(filament_arg))
+    digest.update(repr((input_3mf.name, *profiles, *parts)).encode())
+    key = digest.hexdigest()
+    return output_dir.parent / _SLICE_CACHE_DIRNAME / key[:2] / key
+
+
+def _restore_cached_slice(cache_dir: Path, output_dir: Path, sliced_3mf_name: str) -> bool:
+    """Copy a cached slice's files into *output_dir*. Returns False on a miss."""
+    if not (cache_dir / sliced_3mf_name).is_file():
+        return False
+    for entry in os.scandir(cache_dir):
+        shutil.copy2(entry.path, output_dir / entry.name)
+    log.info("Slice cache hit, reusing %s", cache_dir)
+    return True
+
+
+def _gcode_mtimes(output_dir: Path) -> dict[str, int]:
+    """Return {name: st_mtime_ns} for the .gcode files in *output_dir*."""
+    with os.scandir(output_dir) as it:
+        return {e.name: e.stat().st_mtime_ns for e in it if e.name.endswith(".gcode")}
+
+
+def _store_cached_slice(
+    cache_dir: Path, output_dir: Path, sliced_3mf_name: str, before: dict[str, int]
+) -> None:
+    """Save the slicer's outputs to the cache.
+
+    Outputs are the sliced 3MF plus any .gcode file that is new or changed
+    relative to *before* (from _gcode_mtimes). Best-effort: files are staged
+    in a temp dir and renamed into place, so a failed or concurrent store
+    never leaves a partial entry.
+    """
+    sliced = output_dir / sliced_3mf_name
+    if not sliced.is_file():
+        return
+    outputs = [sliced]
+    outputs += [
+        output_dir / name
+        for name, mtime in _gcode_mtimes(output_dir).items()
+        if before.get(name) != mtime
+    ]
+    try:
+        cache_dir.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=cache_dir.parent, prefix=".tmp"))
+        try:
+            for path in outputs:
+                shutil.copy2(path, staging / path.name)
+            os.rename(staging, cache_dir)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+    except OSError:
+        log.debug("Could not store slice in cache %s", cache_dir, exc_info=True)
+
+
 def slice_plate(
     input_3mf: Path,
     engine: str = "orca",
@@ -439,6 +883,7 @@ def slice_plate(
     local: bool = False,
     docker_version: str | None = None,
     required_version: str | None = None,
+    cache: bool = False,
 ) -> Path:
     """Slice a 3MF file using BambuStudio or OrcaSlicer CLI.
 
@@ -453,6 +898,11 @@ def slice_plate(
     If required_version is set (from config), the slicer version is checked
     and must match exactly. For Docker, the image tag is used as the version.
 
+    With *cache* (opt-in), finished slices are kept in a ``.fabprint-cache``
+    dir next to output_dir, keyed by the input 3MF's contents, the flattened
+    profiles and the slicer, and copied back instead of re-slicing when
+    nothing changed. Entries are never evicted.
+
     Returns the output directory containing the sliced gcode.
     """
     # If config specifies a version and no explicit docker_version was given,
@@ -468,6 +918,15 @@ def slice_plate(
 
     image = _docker_image(docker_version)
 
+    # Resolve profiles in the background while the Docker/slicer checks below
+    # wait on subprocesses; _resolve_profiles then hits the in-process cache.
+    prefetch = threading.Thread(
+        target=_prefetch_profiles,
+        args=(engine, printer, process, filaments, project_dir),
+        daemon=True,
+    )
+    prefetch.start()
+
     if local:
         # Force local — no Docker fallback
         use_docker = False
@@ -499,11 +958,14 @@ def slice_plate(
                     "pull a Docker image: docker pull fabprint/fabprint:orca-2.3.1"
                 )
 
-    # Detect and verify slicer version
+    # Detect and verify slicer version. Probing a local slicer means launching
+    # it, so only do that when a version is actually required.
     if use_docker:
         detected_version = docker_version
-    else:
+    elif required_version:
         detected_version = _detect_slicer_version(slicer)
+    else:
+        detected_version = None
 
     if required_version:
         _check_slicer_version(
@@ -513,92 +975,137 @@ def slice_plate(
     docker_str = " (Docker)" if use_docker else ""
     log.debug("Slicer: OrcaSlicer %s%s", detected_version or "unknown", docker_str)
 
-    input_3mf = input_3mf.resolve()
+    # abspath rather than resolve(): no per-component lstat, and the slicer
+    # (or the Docker tar) only needs an absolute path, not a canonical one
+    input_3mf = Path(os.path.abspath(input_3mf))
     require_file(input_3mf, "Input 3MF file")
 
     if output_dir is None:
         output_dir = input_3mf.parent / "output"
-    output_dir = output_dir.resolve()
+    output_dir = Path(os.path.abspath(output_dir))
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # For Docker: write profiles under output_dir so they share the same mount.
-    # For local: use system temp (faster, auto-cleaned).
-    if use_docker:
-        tmp_dir = output_dir / ".profiles"
-        tmp_dir.mkdir(exist_ok=True)
-    else:
-        tmp_dir = Path(tempfile.mkdtemp(prefix="fabprint_"))
+    # Profiles go to a per-process temp dir shared across slices (removed at
+    # exit); Docker gets them via stdin
+    tmp_dir = _profile_bundle_dir()
+
+    prefetch.join()
+    settings_arg, filament_arg = _resolve_profiles(
+        engine,
+        printer,
+        process,
+        filaments,
+        overrides,
+        project_dir,
+        tmp_dir,
+        path_prefix=_DOCKER_PROFILE_DIR if use_docker else None,
+    )
 
-    try:
-        settings_arg, filament_arg = _resolve_profiles(
-            engine,
-            printer,
-            process,
-            filaments,
-            overrides,
-            project_dir,
-            tmp_dir,
+    sliced_3mf_name = input_3mf.stem + "_sliced.gcode.3mf"
+    cache_dir = None
+    gcode_before: dict[str, int] = {}
+    if cache:
+        # A local slicer is identified by its binary, so upgrades miss the cache
+        slicer_id = image if use_docker else str(slicer)
+        if not use_docker:
+            with contextlib.suppress(OSError):
+                st = slicer.stat()
+                slicer_id += f":{st.st_mtime_ns}:{st.st_size}"
+        cache_dir = _slice_cache_dir(
+            output_dir, input_3mf, settings_arg, filament_arg, engine, slicer_id, filament_ids
         )
+        if _restore_cached_slice(cache_dir, output_dir, sliced_3mf_name):
+            return output_dir
+        gcode_before = _gcode_mtimes(output_dir)
 
-        if use_docker:
-            result_dir = _slice_via_docker(
-                input_3mf,
-                output_dir,
-                tmp_dir,
-                settings_arg,
-                filament_arg,
-                image,
-            )
-            _fix_sliced_3mf(result_dir / (input_3mf.stem + "_sliced.gcode.3mf"), input_3mf)
-            return result_dir
-
-        # Local slicer path
-        cmd = [str(slicer)]
-        if settings_arg:
-            cmd.extend(["--load-settings", settings_arg])
-        if filament_arg:
-            cmd.extend(["--load-filaments", filament_arg])
-
-        # --load-filament-ids only works with STL inputs, not 3MF
-        if filament_ids and not str(input_3mf).endswith(".3mf"):
-            cmd.extend(["--load-filament-ids", ",".join(str(i) for i in filament_ids)])
-
-        sliced_3mf_name = input_3mf.stem + "_sliced.gcode.3mf"
-        cmd.extend(
-            [
-                "--slice",
-                "0",
-                "--export-3mf",
-                sliced_3mf_name,
-                "--min-save",
-                "--outputdir",
-                str(output_dir),
-                str(input_3mf),
-            ]
+    if use_docker:
+        result_dir = _slice_via_docker(
+            input_3mf,
+            output_dir,
+            tmp_dir,
+            settings_arg,
+            filament_arg,
+            image,
         )
+        _fix_sliced_3mf(result_dir / sliced_3mf_name, input_3mf)
+        if cache_dir is not None:
+            _store_cached_slice(cache_dir, result_dir, sliced_3mf_name, gcode_before)
+        return result_dir
+
+    # Local slicer path
+    cmd = [str(slicer)]
+    if settings_arg:
+        cmd.extend(["--load-settings", settings_arg])
+    if filament_arg:
+        cmd.extend(["--load-filaments", filament_arg])
+
+    # --load-filament-ids only works with STL inputs, not 3MF
+    if filament_ids and not str(input_3mf).endswith(".3mf"):
+        cmd.extend(["--load-filament-ids", ",".join(str(i) for i in filament_ids)])
+
+    cmd.extend(
+        [
+            "--slice",
+            "0",
+            "--export-3mf",
+            sliced_3mf_name,
+            "--min-save",
+            "--outputdir",
+            str(output_dir),
+            str(input_3mf),
+        ]
+    )
 
+    if log.isEnabledFor(logging.INFO):
         log.info("Slicing with %s: %s", engine, " ".join(cmd))
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300,
-        )
+    returncode, stderr = _run_slicer(cmd, 300, "Slicer")
 
-        if result.returncode != 0:
-            log.error("Slicer stderr:\n%s", result.stderr)
-            raise RuntimeError(
-                f"Slicer failed (exit code {result.returncode}):\n{result.stderr[:500]}"
-            )
+    if returncode != 0:
+        log.error("Slicer stderr:\n%s", stderr)
+        raise RuntimeError(f"Slicer failed (exit code {returncode}):\n{stderr[-500:]}")
+
+    _fix_sliced_3mf(output_dir / sliced_3mf_name, input_3mf)
+    if cache_dir is not None:
+        _store_cached_slice(cache_dir, output_dir, sliced_3mf_name, gcode_before)
+    log.info("Slicing complete. Output in %s", output_dir)
+    return output_dir
 
-        log.info("Slicer stdout:\n%s", result.stdout)
-        _fix_sliced_3mf(output_dir / sliced_3mf_name, input_3mf)
-        log.info("Slicing complete. Output in %s", output_dir)
-        return output_dir
 
-    finally:
-        shutil.rmtree(tmp_dir, ignore_errors=True)
+@dataclass
+class SliceJob:
+    """One slice for slice_plates(); fields are slice_plate()'s arguments."""
+
+    input_3mf: Path
+    engine: str = "orca"
+    output_dir: Path | None = None
+    printer: str | None = None
+    process: str | None = None
+    filaments: list[str] | None = None
+    filament_ids: list[int] | None = None
+    overrides: dict[str, object] | None = None
+    project_dir: Path | None = None
+    local: bool = False
+    docker_version: str | None = None
+    required_version: str | None = None
+    cache: bool = False
+
+
+def slice_plates(jobs: list[SliceJob], max_workers: int | None = None) -> list[Path]:
+    """Slice several plates concurrently; returns output dirs in job order.
+
+    Each job runs slice_plate() on a worker thread. The slicer subprocesses
+    do the work, so threads are enough. *max_workers* defaults to the CPU
+    count. The first failing job's exception is raised after all jobs end.
+    Jobs should not share an output_dir and input file stem, since their
+    output files would collide.
+    """
+    if not jobs:
+        return []
+    workers = min(len(jobs), max_workers or os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(slice_plate, **vars(job)) for job in jobs]
+    return [future.result() for future in futures]
 
 
 def parse_gcode_stats(output_dir: Path) -> dict[str, str | float | int]:
@@ -607,8 +1114,13 @@ def parse_gcode_stats(output_dir: Path) -> dict[str, str | float | int]:
     Finds the first .gcode file and delegates to gcode.parse_gcode_metadata().
     Returns dict with 'filament_g' and/or 'filament_cm3' and/or 'print_time'.
     """
-    gcode_files = list(output_dir.glob("*.gcode"))
-    if not gcode_files:
+    # Stop at the first match; scandir entries carry the name without a stat
+    try:
+        with os.scandir(output_dir) as it:
+            gcode = next((Path(e.path) for e in it if e.name.endswith(".gcode")), None)
+    except FileNotFoundError:
+        return {}
+    if gcode is None:
         return {}
 
-    return parse_gcode_metadata(gcode_files[0])
+    return parse_gcode_metadata(gcode)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 from pathlib import Path
 
@@ -125,25 +126,27 @@ def _render_plate_thumbnail(width: int, height: int, plate_3mf: Path) -> bytes:
     draw.polygon(bed_pts, fill=(55, 58, 65))
     draw.line(bed_pts + [bed_pts[0]], fill=(75, 78, 85), width=1)
 
-    # Collect part faces with depth for painter's algorithm
-    face_list = []  # (depth, pixel_pts, color)
+    # Collect part faces with depth for painter's algorithm. Depth, shading
+    # and pixel coordinates are computed per mesh as arrays, not per face.
+    # (depth, flat pixel coords, color)
+    face_list: list[tuple[float, list[float], tuple[int, ...]]] = []
     for mesh_idx, mesh in enumerate(meshes):
         fil_id = mesh.metadata.get("filament_id", 1)
         base_color = np.array(palette[(fil_id - 1) % len(palette)], dtype=float)
 
-        projected = all_projected[mesh_idx]
-        normals = mesh.face_normals
+        tris = all_projected[mesh_idx][mesh.faces]  # (faces, 3 verts, xyz)
+        depths = tris[:, :, 2].mean(axis=1)
 
-        for fi, face in enumerate(mesh.faces):
-            verts_proj = projected[face]
-            depth = verts_proj[:, 2].mean()
+        brightness = np.maximum(0.3, mesh.face_normals @ light_dir)
+        colors = np.minimum(255, base_color * brightness[:, None]).astype(int)
 
-            n = normals[fi]
-            brightness = max(0.3, float(np.dot(n, light_dir)))
-            color = tuple(int(min(255, c * brightness)) for c in base_color)
-
-            pts = [to_pixel(verts_proj[i]) for i in range(3)]
-            face_list.append((depth, pts, color))
+        # Flat [x0, y0, x1, y1, x2, y2] per face
+        pixels = np.empty((len(tris), 3, 2))
+        pixels[:, :, 0] = offset_x + tris[:, :, 0] * scale
+        pixels[:, :, 1] = offset_y - tris[:, :, 1] * scale
+        face_list.extend(
+            zip(depths.tolist(), pixels.reshape(-1, 6).tolist(), map(tuple, colors.tolist()))
+        )
 
     # Sort back-to-front: lowest depth = furthest from camera = draw first
     face_list.sort(key=lambda f: f[0])
@@ -156,11 +159,17 @@ def _render_plate_thumbnail(width: int, height: int, plate_3mf: Path) -> bytes:
     return buf.getvalue()
 
 
+@functools.lru_cache(maxsize=4)
 def placeholder_thumbnail(width: int = 256, height: int = 256) -> bytes:
-    """Generate a minimal branded placeholder PNG (no mesh data needed)."""
+    """Generate a minimal branded placeholder PNG (no mesh data needed).
+
+    The output depends only on the size, so results are cached.
+    """
     import struct
     import zlib as _zlib
 
+    import numpy as np
+
     # Colors (RGB)
     bg = (25, 25, 30)
     plate_c = (50, 52, 58)
@@ -184,47 +193,45 @@ def placeholder_thumbnail(width: int = 256, height: int = 256) -> bytes:
     tx = (width - text_w * font_scale) // 2
     ty = height // 2 - (char_h * font_scale) // 2
 
-    rows = []
-    for y in range(height):
-        row = bytearray(width * 3)
-        for x in range(width):
-            mx, my = 20, 40
-            if mx <= x < width - mx and my <= y < height - my:
-                if y <= my + 2:
-                    r, g, b = accent
-                else:
-                    r, g, b = plate_c
-            else:
-                r, g, b = bg
-
-            sx = (x - tx) // font_scale
-            sy = (y - ty) // font_scale
-            if 0 <= sy < char_h and 0 <= sx < text_w:
-                ci = sx // (char_w + spacing)
-                fcx = sx % (char_w + spacing)
-                if ci < len(text) and fcx < char_w:
-                    ch = text[ci]
-                    if ch in _font:
-                        row_bits = _font[ch][sy]
-                        if row_bits & (0x80 >> fcx):
-                            r, g, b = accent
-
-            off = x * 3
-            row[off] = r
-            row[off + 1] = g
-            row[off + 2] = b
-        rows.append(bytes([0]) + bytes(row))
-
-    raw = b"".join(rows)
-    compressed = _zlib.compress(raw)
-
-    def _chunk(ctype: bytes, data: bytes) -> bytes:
-        c = ctype + data
-        crc = _zlib.crc32(c) & 0xFFFFFFFF
-        return struct.pack(">I", len(data)) + c + struct.pack(">I", crc)
-
-    png = b"\x89PNG\r\n\x1a\n"
-    png += _chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
-    png += _chunk(b"IDAT", compressed)
-    png += _chunk(b"IEND", b"")
-    return png
+    img = np.empty((height, width, 3), dtype=np.uint8)
+    img[:] = bg
+    # Plate with an accent band along its top edge
+    mx, my = 20, 40
+    plate = img[my : height - my, mx : width - mx]
+    plate[:] = plate_c
+    plate[:3] = accent
+
+    # Glyph rows -> (char_h, len(text) * 8) bit mask, MSB first; the 8th
+    # column of each glyph is the inter-character spacing
+    glyphs = np.array([_font[ch] for ch in text], dtype=np.uint8).T
+    mask = np.unpackbits(glyphs[:, :, None], axis=2)
+    mask[:, :, char_w:] = 0
+    mask = mask.reshape(char_h, -1)[:, :text_w]
+    mask = np.kron(mask, np.ones((font_scale, font_scale), dtype=np.uint8)).astype(bool)
+
+    # Clip the scaled text to the image and paint it
+    y0, x0 = max(ty, 0), max(tx, 0)
+    y1 = min(ty + mask.shape[0], height)
+    x1 = min(tx + mask.shape[1], width)
+    if y0 < y1 and x0 < x1:
+        img[y0:y1, x0:x1][mask[y0 - ty : y1 - ty, x0 - tx : x1 - tx]] = accent
+
+    # PNG scanlines: filter byte 0 followed by the row's RGB bytes
+    rows = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+    rows[:, 1:] = img.reshape(height, width * 3)
+
+    compressed = _zlib.compress(rows.tobytes())
+
+    def _chunk(ctype: bytes, data: bytes) -> list[bytes]:
+        # CRC the type then the data incrementally; no ctype + data copy
+        crc = _zlib.crc32(data, _zlib.crc32(ctype))
+        return [struct.pack(">I", len(data)), ctype, data, struct.pack(">I", crc)]
+
+    return b"".join(
+        [
+            b"\x89PNG\r\n\x1a\n",
+            *_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)),
+            *_chunk(b"IDAT", compressed),
+            *_chunk(b"IEND", b""),
+        ]
+    )
@@ -2,14 +2,39 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import ModuleType
 
+import numpy as np
 import trimesh
 
 log = logging.getLogger(__name__)
 
+# Upper bound on threads used to write temporary STLs for the OCP viewer
+_EXPORT_MAX_WORKERS = 8
+
+# Binary STL facet record: normal, three vertices, attribute byte count
+_STL_FACET = np.dtype([("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attr", "<u2")])
+
+
+def _write_stl(mesh: trimesh.Trimesh, path: str) -> None:
+    """Write *mesh* as binary STL straight from a structured array.
+
+    Same bytes as mesh.export(), without building the whole file as an
+    in-memory bytes object (and concatenating the header onto it) first.
+    """
+    facets = np.zeros(len(mesh.faces), dtype=_STL_FACET)
+    facets["normal"] = mesh.face_normals
+    facets["vertices"] = mesh.triangles
+    with open(path, "wb") as f:
+        f.write(bytes(80))  # header
+        f.write(np.uint32(len(facets)).tobytes())
+        facets.tofile(f)
+
 
 def show_plate(
     meshes: list[trimesh.Trimesh],
@@ -22,12 +47,36 @@ def show_plate(
     _try_trimesh(meshes, names, plate_size)
 
 
+@functools.lru_cache(maxsize=8)
+def _plate_box(w: float, h: float) -> trimesh.Trimesh:
+    """Build (once per plate size) the thin box behind _make_plate_outline."""
+    # bounds places the box directly, with no separate translate pass
+    return trimesh.creation.box(bounds=[[0.0, 0.0, -0.5], [w, h, 0.0]])
+
+
 def _make_plate_outline(plate_size: tuple[float, float]) -> trimesh.Trimesh:
-    """Create a thin transparent rectangle representing the build plate."""
+    """Create a thin transparent rectangle representing the build plate.
+
+    Returns a fresh copy of a cached box, so callers may recolour it.
+    """
     w, h = plate_size
-    plate = trimesh.creation.box(extents=[w, h, 0.5])
-    plate.apply_translation([w / 2, h / 2, -0.25])
-    return plate
+    return _plate_box(float(w), float(h)).copy()
+
+
+@functools.cache
+def _ocp_modules() -> tuple[ModuleType, ModuleType] | None:
+    """Import build123d and ocp_vscode once; None if either is missing.
+
+    Imported lazily (build123d pulls in OCCT), but the outcome is cached:
+    Python doesn't remember failed imports, so each miss would rescan sys.path.
+    """
+    try:
+        import build123d
+        import ocp_vscode
+    except ImportError:
+        log.debug("ocp_vscode or build123d not available, skipping OCP viewer")
+        return None
+    return build123d, ocp_vscode
 
 
 def _try_ocp(
@@ -36,31 +85,27 @@ def _try_ocp(
     plate_size: tuple[float, float],
 ) -> bool:
     """Try displaying via ocp_vscode. Returns True if successful."""
-    try:
-        from build123d import Box, Color, Location, import_stl
-        from ocp_vscode import show
-    except ImportError:
-        log.debug("ocp_vscode or build123d not available, skipping OCP viewer")
+    modules = _ocp_modules()
+    if modules is None:
         return False
+    build123d, ocp_vscode = modules
 
-    solids = []
-    for i, mesh in enumerate(meshes):
-        with tempfile.NamedTemporaryFile(suffix=".stl", delete=False) as tmp:
-            tmp_path = Path(tmp.name)
-        try:
-            mesh.export(str(tmp_path))
-            solid = import_stl(str(tmp_path))
-            solids.append(solid)
-        finally:
-            tmp_path.unlink(missing_ok=True)
+    # One temp dir for all parts; STL encoding is numpy work that releases
+    # the GIL, so exports run in parallel. OCCT import stays sequential.
+    with tempfile.TemporaryDirectory(prefix="fabprint_view_") as td:
+        paths = [str(Path(td) / f"part_{i}.stl") for i in range(len(meshes))]
+        if meshes:
+            with ThreadPoolExecutor(max_workers=min(_EXPORT_MAX_WORKERS, len(meshes))) as pool:
+                list(pool.map(_write_stl, meshes, paths))
+        solids = [build123d.import_stl(path) for path in paths]
 
     # Ghost build plate
     w, h = plate_size
-    plate_box = Location((w / 2, h / 2, -0.25)) * Box(w, h, 0.5)
-    plate_box.color = Color(0.8, 0.8, 0.8, 0.3)
+    plate_box = build123d.Location((w / 2, h / 2, -0.25)) * build123d.Box(w, h, 0.5)
+    plate_box.color = build123d.Color(0.8, 0.8, 0.8, 0.3)
 
     log.info("Showing plate in OCP viewer (%d parts)", len(solids))
-    show(*solids, plate_box)
+    ocp_vscode.show(*solids, plate_box)
     return True
 
 
@@ -1,7 +1,9 @@
 """Generate test fixture STL files."""
 
+import itertools
 from pathlib import Path
 
+import pytest
 import trimesh
 
 FIXTURES = Path(__file__).parent / "fixtures"
@@ -20,3 +22,37 @@ def pytest_configure(config):
     if not cyl_path.exists():
         mesh = trimesh.creation.cylinder(radius=5, height=20)
         mesh.export(cyl_path)
+
+
+@pytest.fixture(scope="session")
+def cube_mesh() -> trimesh.Trimesh:
+    """The 10mm cube fixture, loaded once per session. Tests should .copy() it."""
+    return trimesh.load_mesh(FIXTURES / "cube_10mm.stl", file_type="stl")
+
+
+@pytest.fixture(scope="session")
+def cylinder_mesh() -> trimesh.Trimesh:
+    """The 5x20mm cylinder fixture, loaded once per session. Tests should .copy() it."""
+    return trimesh.load_mesh(FIXTURES / "cylinder_5x20mm.stl", file_type="stl")
+
+
+@pytest.fixture(scope="session")
+def _profile_cache_root(tmp_path_factory):
+    return tmp_path_factory.mktemp("cache")
+
+
+_cache_ids = itertools.count()
+
+
+@pytest.fixture(autouse=True)
+def _isolate_profile_caches(_profile_cache_root, monkeypatch):
+    """Keep profile caches out of the real ~/.cache during tests.
+
+    Each test gets its own (not yet created) dir under one session dir; the
+    cache code creates it on first write, so most tests cost no mkdir.
+    """
+    cache = _profile_cache_root / str(next(_cache_ids))
+    monkeypatch.setattr("fabprint.profiles._PROFILE_CACHE_PATH", cache / "profiles.json")
+    monkeypatch.setattr("fabprint.profiles._RESOLVED_CACHE_DIR", cache / "resolved")
+    monkeypatch.setattr("fabprint.profiles._RESOLVED_MEMO", {})
+    monkeypatch.setattr("fabprint.profiles._PROFILE_JSON_MEMO", {})
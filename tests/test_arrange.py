@@ -1,22 +1,15 @@
 """Tests for bin packing arrangement."""
 
-from pathlib import Path
-
+import numpy as np
 import pytest
 import trimesh
 
 from fabprint.arrange import arrange
 
-FIXTURES = Path(__file__).parent / "fixtures"
-
-
-def _load(name: str) -> trimesh.Trimesh:
-    return trimesh.load(str(FIXTURES / name))
 
-
-def test_arrange_two_cubes():
-    m1 = _load("cube_10mm.stl")
-    m2 = _load("cube_10mm.stl")
+def test_arrange_two_cubes(cube_mesh):
+    m1 = cube_mesh.copy()
+    m2 = cube_mesh.copy()
     placements = arrange([m1, m2], ["a", "b"], plate_size=(256, 256), padding=5.0)
     assert len(placements) == 2
 
@@ -28,24 +21,17 @@ def test_arrange_two_cubes():
         assert p.mesh.bounds[1][1] <= 256  # max Y <= plate depth
 
 
-def test_arrange_no_overlap():
-    meshes = [_load("cube_10mm.stl") for _ in range(4)]
+def test_arrange_no_overlap(cube_mesh):
+    meshes = [cube_mesh.copy() for _ in range(4)]
     names = [f"cube_{i}" for i in range(4)]
     placements = arrange(meshes, names, plate_size=(256, 256), padding=5.0)
 
-    # Check no XY overlap between any pair of placed meshes
-    boxes = []
-    for p in placements:
-        xmin, ymin = p.mesh.bounds[0][0], p.mesh.bounds[0][1]
-        xmax, ymax = p.mesh.bounds[1][0], p.mesh.bounds[1][1]
-        boxes.append((xmin, ymin, xmax, ymax))
-
-    for i in range(len(boxes)):
-        for j in range(i + 1, len(boxes)):
-            a, b = boxes[i], boxes[j]
-            overlap_x = a[0] < b[2] and a[2] > b[0]
-            overlap_y = a[1] < b[3] and a[3] > b[1]
-            assert not (overlap_x and overlap_y), f"Parts {i} and {j} overlap"
+    # Check no XY overlap between any pair of placed meshes: (N, 2) mins/maxes
+    bounds = np.array([p.mesh.bounds[:, :2] for p in placements])
+    lo, hi = bounds[:, 0], bounds[:, 1]
+    overlap = ((lo[:, None] < hi[None, :]) & (hi[:, None] > lo[None, :])).all(axis=2)
+    np.fill_diagonal(overlap, False)
+    assert not overlap.any(), f"Parts overlap: {np.argwhere(np.triu(overlap)).tolist()}"
 
 
 def test_arrange_overflow():
@@ -18,11 +18,11 @@ from fabprint.cli import (
     _version_callback,
     main,
 )
-from fabprint.profiles import SYSTEM_DIRS
+from fabprint.profiles import system_dir
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
-_orca_system = SYSTEM_DIRS.get("orca")
+_orca_system = system_dir("orca")
 _has_orca = _orca_system is not None and _orca_system.is_dir()
 
 
@@ -35,23 +35,32 @@ def _docker_orca_version() -> str | None:
     env_ver = os.environ.get("FABPRINT_TEST_ORCA_VERSION")
     if env_ver:
         return env_ver
+    if shutil.which("docker") is None:
+        return None
     try:
+        # Let docker filter by reference rather than listing every image
         r = subprocess.run(
-            ["docker", "image", "ls", "--format", "{{.Repository}}:{{.Tag}}"],
+            [
+                "docker",
+                "image",
+                "ls",
+                "--filter",
+                "reference=fabprint:orca-*",
+                "--format",
+                "{{.Tag}}",
+            ],
             capture_output=True,
             text=True,
             timeout=10,
         )
-        versions = []
-        for line in r.stdout.splitlines():
-            if line.startswith("fabprint:orca-"):
-                versions.append(line.split("fabprint:orca-", 1)[1])
-        # Prefer stable releases over pre-releases, sorted by version number
-        stable = [v for v in versions if not Version(v).is_prerelease]
-        if stable:
-            return max(stable, key=Version)
-        if versions:
-            return max(versions, key=Version)
+        versions = [
+            line.removeprefix("orca-") for line in r.stdout.splitlines() if line.startswith("orca-")
+        ]
+        # Prefer stable releases over pre-releases, then the highest version.
+        # Parse each tag once
+        parsed = [(Version(v), v) for v in versions]
+        if parsed:
+            return max(parsed, key=lambda pv: (not pv[0].is_prerelease, pv[0]))[1]
     except (FileNotFoundError, subprocess.TimeoutExpired):
         pass
     return None
@@ -63,9 +72,9 @@ skip_no_docker = pytest.mark.skipif(
 )
 
 
-def _posix(p: Path) -> str:
-    """Return a forward-slash path string (avoids TOML backslash escaping on Windows)."""
-    return p.as_posix()
+# Fixture paths as forward-slash strings (avoids TOML backslash escaping on Windows)
+CUBE_POSIX = (FIXTURES / "cube_10mm.stl").as_posix()
+CYL_POSIX = (FIXTURES / "cylinder_5x20mm.stl").as_posix()
 
 
 def _write_config(tmp_path: Path, engine: str = "orca") -> Path:
@@ -79,12 +88,12 @@ padding = 5.0
 engine = "{engine}"
 
 [[parts]]
-file = "{_posix(FIXTURES / "cube_10mm.stl")}"
+file = "{CUBE_POSIX}"
 copies = 2
 orient = "flat"
 
 [[parts]]
-file = "{_posix(FIXTURES / "cylinder_5x20mm.stl")}"
+file = "{CYL_POSIX}"
 orient = "upright"
 """)
     return toml
@@ -179,7 +188,7 @@ engine = "orca"
 stages = ["load", "arrange", "plate"]
 
 [[parts]]
-file = "{_posix(FIXTURES / "cube_10mm.stl")}"
+file = "{CUBE_POSIX}"
 """)
     output_dir = tmp_path / "output"
     # Running all stages (only up to plate since that's all that's configured)
@@ -200,7 +209,7 @@ size = [256, 256]
 engine = "orca"
 
 [[parts]]
-file = "{_posix(FIXTURES / "cube_10mm.stl")}"
+file = "{CUBE_POSIX}"
 """)
     monkeypatch.chdir(tmp_path)
     main(["run", str(toml), "--until", "plate"])
@@ -220,7 +229,7 @@ size = [256, 256]
 engine = "orca"
 
 [[parts]]
-file = "{_posix(FIXTURES / "cube_10mm.stl")}"
+file = "{CUBE_POSIX}"
 """)
     output_dir = tmp_path / "custom"
     main(["run", str(toml), "-o", str(output_dir), "--until", "plate"])
@@ -241,7 +250,7 @@ engine = "orca"
 stages = ["load", "arrange", "foobar"]
 
 [[parts]]
-file = "{_posix(FIXTURES / "cube_10mm.stl")}"
+file = "{CUBE_POSIX}"
 """)
     with pytest.raises(SystemExit) as exc_info:
         main(["run", str(toml)])
@@ -266,7 +275,7 @@ process = "0.20mm Standard @BBL X1C"
 filaments = ["Generic PLA @base"]
 
 [[parts]]
-file = "{_posix(FIXTURES / "cube_10mm.stl")}"
+file = "{CUBE_POSIX}"
 """)
     main(["profiles", "pin", str(config)])
     assert (tmp_path / "profiles" / "machine" / "Bambu Lab P1S 0.4 nozzle.json").exists()
@@ -307,7 +316,7 @@ process = "0.20mm Standard @BBL X1C"
 filaments = [{filament_toml}]
 
 [[parts]]
-file = "{_posix(FIXTURES / "cube_10mm.stl")}"
+file = "{CUBE_POSIX}"
 copies = 1
 """)
     return toml
@@ -450,9 +459,26 @@ def test_resolve_config_path_missing(tmp_path, monkeypatch):
 
 
 def test_resolve_status_printers_by_name():
-    load_fn = MagicMock(return_value={"type": "bambu-lan", "ip": "1.2.3.4"})
+    from fabprint.credentials import PrinterCredentials
+
+    creds = PrinterCredentials(
+        type="bambu-lan", ip="1.2.3.4", access_code=None, serial=None, url=None, api_key=None
+    )
+    load_fn = MagicMock(return_value=creds)
     result = _resolve_status_printers("my-printer", None, MagicMock(), load_fn)
-    assert result == [("my-printer", {"type": "bambu-lan", "ip": "1.2.3.4"})]
+    assert result == [
+        (
+            "my-printer",
+            {
+                "type": "bambu-lan",
+                "ip": "1.2.3.4",
+                "access_code": None,
+                "serial": None,
+                "url": None,
+                "api_key": None,
+            },
+        )
+    ]
     load_fn.assert_called_once_with("my-printer")
 
 
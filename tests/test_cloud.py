@@ -2,12 +2,14 @@
 
 import io
 import json
+import subprocess
 import xml.etree.ElementTree as ET
 import zipfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
 from fabprint.cloud import (
     PersistentBridge,
@@ -39,12 +41,24 @@ def threemf_file(tmp_path):
 
     f = tmp_path / "test.3mf"
     buf = io.BytesIO()
-    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(buf, "w") as zf:
         zf.writestr("Metadata/model_settings.config", "<config/>")
     f.write_bytes(buf.getvalue())
     return f
 
 
+@pytest.fixture
+def mock_bridge(monkeypatch):
+    """Patch _run_bridge; tests set return_value.stdout etc. on the result.
+
+    The result is a real CompletedProcess (exit 0, empty output) rather than
+    a MagicMock, so unset attributes can't pass as truthy mocks.
+    """
+    mock = MagicMock(return_value=subprocess.CompletedProcess([], 0, stdout="", stderr=""))
+    monkeypatch.setattr("fabprint.cloud.bridge._run_bridge", mock)
+    return mock
+
+
 class TestFindBridge:
     def test_env_var_override(self, tmp_path, monkeypatch):
         bridge = tmp_path / "my_bridge"
@@ -78,44 +92,35 @@ class TestCloudPrint:
         with pytest.raises(FileNotFoundError, match="Token"):
             cloud_print(threemf_file, "DEV123", Path("/nonexistent_token.json"))
 
-    def test_success(self, threemf_file, token_file):
-        mock_result = MagicMock()
-        mock_result.stdout = (
+    def test_success(self, threemf_file, token_file, mock_bridge):
+        mock_bridge.return_value.stdout = (
             '{"result":"success","return_code":0,'
             '"print_result":0,"device_id":"DEV123","file":"test.3mf"}'
         )
-        mock_result.stderr = ""
-        mock_result.returncode = 0
 
-        with patch("fabprint.cloud.bridge._run_bridge", return_value=mock_result):
-            result = cloud_print(threemf_file, "DEV123", token_file)
-            assert result["result"] == "success"
-            assert result["return_code"] == 0
+        result = cloud_print(threemf_file, "DEV123", token_file)
+        assert result["result"] == "success"
+        assert result["return_code"] == 0
 
-    def test_non_json_output(self, threemf_file, token_file):
-        mock_result = MagicMock()
-        mock_result.stdout = "some garbage output"
-        mock_result.stderr = "error details"
-        mock_result.returncode = 1
+    def test_non_json_output(self, threemf_file, token_file, mock_bridge):
+        mock_bridge.return_value.stdout = "some garbage output"
+        mock_bridge.return_value.stderr = "error details"
+        mock_bridge.return_value.returncode = 1
 
-        with patch("fabprint.cloud.bridge._run_bridge", return_value=mock_result):
-            with pytest.raises(RuntimeError, match="non-JSON"):
-                cloud_print(threemf_file, "DEV123", token_file)
+        with pytest.raises(RuntimeError, match="non-JSON"):
+            cloud_print(threemf_file, "DEV123", token_file)
 
-    def test_with_config_3mf(self, threemf_file, token_file, tmp_path):
+    def test_with_config_3mf(self, threemf_file, token_file, tmp_path, mock_bridge):
         config = tmp_path / "config.3mf"
         config.write_bytes(b"PK\x03\x04config")
 
-        mock_result = MagicMock()
-        mock_result.stdout = (
+        mock_bridge.return_value.stdout = (
             '{"result":"success","return_code":0,"print_result":0,"device_id":"DEV","file":"t.3mf"}'
         )
-        mock_result.stderr = ""
 
-        with patch("fabprint.cloud.bridge._run_bridge", return_value=mock_result) as mock_run:
-            cloud_print(threemf_file, "DEV", token_file, config_3mf=config)
-            args = mock_run.call_args[0][0]
-            assert "--config-3mf" in args
+        cloud_print(threemf_file, "DEV", token_file, config_3mf=config)
+        args = mock_bridge.call_args[0][0]
+        assert "--config-3mf" in args
 
 
 class TestCloudStatus:
@@ -123,24 +128,19 @@ class TestCloudStatus:
         with pytest.raises(FileNotFoundError, match="Token"):
             cloud_status("DEV123", Path("/nonexistent_token.json"))
 
-    def test_success(self, token_file):
-        mock_result = MagicMock()
-        mock_result.stdout = '{"print":{"gcode_state":"IDLE","bed_temper":22.5}}'
-        mock_result.returncode = 0
+    def test_success(self, token_file, mock_bridge):
+        mock_bridge.return_value.stdout = '{"print":{"gcode_state":"IDLE","bed_temper":22.5}}'
 
-        with patch("fabprint.cloud.bridge._run_bridge", return_value=mock_result):
-            status = cloud_status("DEV123", token_file)
-            assert status["gcode_state"] == "IDLE"
-            assert status["bed_temper"] == 22.5
+        status = cloud_status("DEV123", token_file)
+        assert status["gcode_state"] == "IDLE"
+        assert status["bed_temper"] == 22.5
 
-    def test_no_status(self, token_file):
-        mock_result = MagicMock()
-        mock_result.stdout = ""
-        mock_result.returncode = 2
+    def test_no_status(self, token_file, mock_bridge):
+        mock_bridge.return_value.stdout = ""
+        mock_bridge.return_value.returncode = 2
 
-        with patch("fabprint.cloud.bridge._run_bridge", return_value=mock_result):
-            with pytest.raises(RuntimeError, match="No status"):
-                cloud_status("DEV123", token_file)
+        with pytest.raises(RuntimeError, match="No status"):
+            cloud_status("DEV123", token_file)
 
 
 class TestCloudTasks:
@@ -148,15 +148,14 @@ class TestCloudTasks:
         with pytest.raises(FileNotFoundError, match="Token"):
             cloud_tasks(Path("/nonexistent_token.json"))
 
-    def test_success(self, token_file):
-        mock_result = MagicMock()
-        mock_result.stdout = '{"total":2,"hits":[{"id":1,"title":"job1"},{"id":2,"title":"job2"}]}'
-        mock_result.returncode = 0
+    def test_success(self, token_file, mock_bridge):
+        mock_bridge.return_value.stdout = (
+            '{"total":2,"hits":[{"id":1,"title":"job1"},{"id":2,"title":"job2"}]}'
+        )
 
-        with patch("fabprint.cloud.bridge._run_bridge", return_value=mock_result):
-            tasks = cloud_tasks(token_file, limit=5)
-            assert len(tasks) == 2
-            assert tasks[0]["title"] == "job1"
+        tasks = cloud_tasks(token_file, limit=5)
+        assert len(tasks) == 2
+        assert tasks[0]["title"] == "job1"
 
 
 class TestCloudCancel:
@@ -164,15 +163,12 @@ class TestCloudCancel:
         with pytest.raises(FileNotFoundError, match="Token"):
             cloud_cancel("DEV123", Path("/nonexistent_token.json"))
 
-    def test_success(self, token_file):
-        mock_result = MagicMock()
-        mock_result.stdout = '{"command":"stop","device_id":"DEV123","sent":true}'
-        mock_result.returncode = 0
+    def test_success(self, token_file, mock_bridge):
+        mock_bridge.return_value.stdout = '{"command":"stop","device_id":"DEV123","sent":true}'
 
-        with patch("fabprint.cloud.bridge._run_bridge", return_value=mock_result):
-            result = cloud_cancel("DEV123", token_file)
-            assert result["sent"] is True
-            assert result["device_id"] == "DEV123"
+        result = cloud_cancel("DEV123", token_file)
+        assert result["sent"] is True
+        assert result["device_id"] == "DEV123"
 
 
 # ---------------------------------------------------------------------------
@@ -293,6 +289,73 @@ class TestPersistentBridge:
             bridge = PersistentBridge(token_file, "DEV123")
             with pytest.raises(RuntimeError, match="failed to start"):
                 bridge.__enter__()
+            mock_proc.kill.assert_called_once()
+            assert bridge._proc is None
+
+    def test_enter_times_out_waiting_for_ready(self, token_file):
+        """Should kill the container if the ready signal never arrives."""
+        import threading
+
+        mock_proc = self._make_mock_proc()
+        release = threading.Event()
+        mock_proc.stdout.readline = MagicMock(side_effect=lambda: release.wait(5) and "")
+        with patch("fabprint.cloud.bridge.subprocess.Popen", return_value=mock_proc):
+            bridge = PersistentBridge(token_file, "DEV123", ready_timeout=0)
+            try:
+                with pytest.raises(RuntimeError, match="did not become ready"):
+                    bridge.__enter__()
+            finally:
+                release.set()
+            mock_proc.kill.assert_called_once()
+            assert bridge._proc is None
+
+
+# ---------------------------------------------------------------------------
+# HTTP upload retry tests
+# ---------------------------------------------------------------------------
+
+
+class TestWithBackoff:
+    def test_retries_transient_errors(self):
+        from fabprint.cloud.http import _with_backoff
+
+        fn = MagicMock(
+            side_effect=[requests.ConnectionError("reset"), requests.Timeout("slow"), "ok"]
+        )
+        with patch("fabprint.cloud.http.time.sleep") as mock_sleep:
+            assert _with_backoff(fn, base=0.5, cap=4.0) == "ok"
+        assert fn.call_count == 3
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert 0.5 <= delays[0] < 0.6
+        assert 1.0 <= delays[1] < 1.1
+
+    def test_reraises_after_last_try(self):
+        from fabprint.cloud.http import _with_backoff
+
+        fn = MagicMock(side_effect=requests.ConnectionError("down"))
+        with patch("fabprint.cloud.http.time.sleep") as mock_sleep:
+            with pytest.raises(requests.ConnectionError, match="down"):
+                _with_backoff(fn, tries=3)
+        assert fn.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    def test_does_not_retry_other_errors(self):
+        from fabprint.cloud.http import _with_backoff
+
+        fn = MagicMock(side_effect=ValueError("bad"))
+        with pytest.raises(ValueError):
+            _with_backoff(fn)
+        assert fn.call_count == 1
+
+    def test_does_not_retry_permanent_request_errors(self):
+        from fabprint.cloud.http import _with_backoff
+
+        fn = MagicMock(side_effect=requests.exceptions.MissingSchema("no scheme"))
+        with patch("fabprint.cloud.http.time.sleep") as mock_sleep:
+            with pytest.raises(requests.exceptions.MissingSchema):
+                _with_backoff(fn)
+        assert fn.call_count == 1
+        mock_sleep.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -758,7 +821,7 @@ def _make_3mf(
     )
     path = tmp_path / name
     buf = io.BytesIO()
-    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(buf, "w") as zf:
         zf.writestr("Metadata/slice_info.config", slice_info)
         zf.writestr("Metadata/project_settings.config", project_settings)
         zf.writestr("Metadata/model_settings.config", "<config/>")
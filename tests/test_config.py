@@ -81,57 +81,46 @@ file = "cube.stl"
     assert cfg.parts[0].orient == "flat"
 
 
-def test_missing_parts(tmp_path):
-    path = _write_toml(
-        tmp_path,
-        """
-[plate]
-size = [200, 200]
-""",
-    )
-    with pytest.raises(FabprintError, match="At least one"):
-        load_config(path)
-
-
-def test_bad_orient(tmp_path):
-    path = _write_toml(
-        tmp_path,
-        """
-[[parts]]
-file = "cube.stl"
-orient = "diagonal"
-""",
-        create_files=["cube.stl"],
-    )
-    with pytest.raises(FabprintError, match="orient"):
-        load_config(path)
-
-
-def test_bad_plate_size(tmp_path):
-    path = _write_toml(
-        tmp_path,
-        """
-[plate]
-size = [-1, 200]
-
-[[parts]]
-file = "cube.stl"
-""",
-        create_files=["cube.stl"],
-    )
-    with pytest.raises(FabprintError, match="plate.size"):
-        load_config(path)
-
-
-def test_missing_file(tmp_path):
-    path = _write_toml(
-        tmp_path,
-        """
-[[parts]]
-file = "nonexistent.stl"
-""",
-    )
-    with pytest.raises(FabprintError, match="nonexistent.stl"):
+@pytest.mark.parametrize(
+    ("content", "create_files", "match"),
+    [
+        ("[plate]\nsize = [200, 200]\n", [], "At least one"),
+        ('[[parts]]\nfile = "cube.stl"\norient = "diagonal"\n', ["cube.stl"], "orient"),
+        (
+            '[plate]\nsize = [-1, 200]\n\n[[parts]]\nfile = "cube.stl"\n',
+            ["cube.stl"],
+            "plate.size",
+        ),
+        ('[[parts]]\nfile = "nonexistent.stl"\n', [], "nonexistent.stl"),
+        ('[[parts]]\nfile = "cube.stl"\nfilament = 0\n', ["cube.stl"], "filament"),
+        ('[[parts]]\nfile = "cube.stl"\ncopies = 0\n', ["cube.stl"], "copies"),
+        (
+            '[slicer]\nengine = "cura"\n\n[[parts]]\nfile = "cube.stl"\n',
+            ["cube.stl"],
+            "engine",
+        ),
+        ('[[parts]]\nfile = "cube.stl"\nscale = 0\n', ["cube.stl"], "scale"),
+        (
+            '[slicer]\ncache = "yes"\n\n[[parts]]\nfile = "cube.stl"\n',
+            ["cube.stl"],
+            "slicer.cache",
+        ),
+    ],
+    ids=[
+        "missing_parts",
+        "bad_orient",
+        "bad_plate_size",
+        "missing_file",
+        "bad_filament",
+        "bad_copies",
+        "bad_engine",
+        "bad_scale",
+        "bad_cache",
+    ],
+)
+def test_invalid_config(tmp_path, content, create_files, match):
+    path = _write_toml(tmp_path, content, create_files=create_files)
+    with pytest.raises(FabprintError, match=match):
         load_config(path)
 
 
@@ -148,50 +137,6 @@ file = "cube.stl"
     assert cfg.parts[0].filament == 1
 
 
-def test_bad_filament(tmp_path):
-    path = _write_toml(
-        tmp_path,
-        """
-[[parts]]
-file = "cube.stl"
-filament = 0
-""",
-        create_files=["cube.stl"],
-    )
-    with pytest.raises(FabprintError, match="filament"):
-        load_config(path)
-
-
-def test_bad_copies(tmp_path):
-    path = _write_toml(
-        tmp_path,
-        """
-[[parts]]
-file = "cube.stl"
-copies = 0
-""",
-        create_files=["cube.stl"],
-    )
-    with pytest.raises(FabprintError, match="copies"):
-        load_config(path)
-
-
-def test_bad_engine(tmp_path):
-    path = _write_toml(
-        tmp_path,
-        """
-[slicer]
-engine = "cura"
-
-[[parts]]
-file = "cube.stl"
-""",
-        create_files=["cube.stl"],
-    )
-    with pytest.raises(FabprintError, match="engine"):
-        load_config(path)
-
-
 def test_scale(tmp_path):
     path = _write_toml(
         tmp_path,
@@ -219,20 +164,6 @@ file = "cube.stl"
     assert cfg.parts[0].scale == 1.0
 
 
-def test_bad_scale(tmp_path):
-    path = _write_toml(
-        tmp_path,
-        """
-[[parts]]
-file = "cube.stl"
-scale = 0
-""",
-        create_files=["cube.stl"],
-    )
-    with pytest.raises(FabprintError, match="scale"):
-        load_config(path)
-
-
 def test_overrides(tmp_path):
     path = _write_toml(
         tmp_path,
@@ -267,6 +198,7 @@ file = "cube.stl"
     )
     cfg = load_config(path)
     assert cfg.slicer.overrides == {}
+    assert cfg.slicer.cache is False
 
 
 def test_version(tmp_path):
@@ -335,10 +335,10 @@ class TestLoadPrinterCredentials:
         monkeypatch.setenv("BAMBU_SERIAL", "ENVSERIAL")
 
         creds = load_printer_credentials("test")
-        assert creds["ip"] == "192.168.1.99"
-        assert creds["access_code"] == "envcode"
-        assert creds["serial"] == "ENVSERIAL"
-        assert creds["type"] == "bambu-lan"
+        assert creds.ip == "192.168.1.99"
+        assert creds.access_code == "envcode"
+        assert creds.serial == "ENVSERIAL"
+        assert creds.type == "bambu-lan"
 
     def test_no_name_returns_env_only(self, monkeypatch):
         """With name=None, only env vars are returned."""
@@ -349,10 +349,10 @@ class TestLoadPrinterCredentials:
         monkeypatch.setenv("BAMBU_SERIAL", "SN123")
 
         creds = load_printer_credentials(None)
-        assert creds["ip"] == "1.2.3.4"
-        assert creds["access_code"] == "code"
-        assert creds["serial"] == "SN123"
-        assert creds["type"] is None
+        assert creds.ip == "1.2.3.4"
+        assert creds.access_code == "code"
+        assert creds.serial == "SN123"
+        assert creds.type is None
 
     def test_missing_credentials_file_raises(self, tmp_path, monkeypatch):
         """Raises FabprintError when credentials file doesn't exist."""
@@ -48,6 +48,86 @@ def test_parse_minutes_only(tmp_path):
     assert stats["print_time_secs"] == 45 * 60 + 10
 
 
+def test_parse_print_time_with_days(tmp_path):
+    gcode = tmp_path / "test.gcode"
+    gcode.write_text("; total estimated time: 1d 2h 3m 4s\nG28\n")
+    stats = parse_gcode_metadata(gcode)
+    assert stats["print_time_secs"] == 86400 + 2 * 3600 + 3 * 60 + 4
+
+
+def test_parse_print_time_first_match_wins(tmp_path):
+    gcode = tmp_path / "modes.gcode"
+    gcode.write_text(
+        "; estimated printing time (normal mode) = 1h 2m 3s\n"
+        "; estimated printing time (silent mode) = 2h 0m 0s\n"
+    )
+    stats = parse_gcode_metadata(gcode)
+    assert stats["print_time"] == "1h 2m 3s"
+    assert stats["print_time_secs"] == 3723
+
+
+def test_analyze_print_time_first_match_wins(tmp_path):
+    gcode = tmp_path / "modes.gcode"
+    gcode.write_text(
+        "; estimated printing time (normal mode) = 1h 2m 3s\n"
+        "; estimated printing time (silent mode) = 2h 0m 0s\n"
+    )
+    assert analyze_gcode(gcode).print_time == "1h 2m 3s"
+    assert parse_gcode_metadata(gcode)["print_time"] == "1h 2m 3s"
+
+
+def test_parse_filament_totals_and_slots(tmp_path):
+    """Total lines win over per-slot lines; slot lines are summed otherwise."""
+    gcode = tmp_path / "mixed.gcode"
+    gcode.write_text(
+        "G28\n"
+        ";filament used [g] = 1.0\n"
+        "; filament used [g] = 2.0\n"
+        "; total filament used [g] = 5.5\n"
+        "; filament used [cm3] = 0.75\n"
+        "; filament used [cm3] = 0.25\n"
+        "; filament used [mm] = 123.0\n"
+        "G1 X0 ; filament used [g] = 99\n"
+    )
+    stats = parse_gcode_metadata(gcode)
+    assert stats["filament_g"] == 5.5
+    assert stats["filament_cm3"] == 1.0
+
+
+def test_used_value():
+    from fabprint.gcode import _used_value
+
+    assert _used_value(" = 12.34") == 12.34
+    assert _used_value("=1.5, 2.0") == 1.5
+    assert _used_value(" = abc") is None
+    assert _used_value(" 12.34") is None
+
+
+def test_parse_large_gcode_reads_only_ends(tmp_path, monkeypatch):
+    """Header/tail are found in a file much larger than the read block."""
+    monkeypatch.setattr("fabprint.gcode._READ_BLOCK", 256)
+    header = "; total estimated time: 3m 5s\n"
+    body = "G1 X1 Y1 E0.1 ; total estimated time: 9h\n" * 2000
+    tail = "".join(f"; filament used [g] = {g}\n" for g in ("1.5", "2.5"))
+    gcode = tmp_path / "big.gcode"
+    gcode.write_text(header + "G28\n" * 400 + body + tail)
+
+    stats = parse_gcode_metadata(gcode)
+    assert stats["print_time"] == "3m 5s"
+    assert stats["filament_g"] == 4.0
+
+
+def test_read_head_tail_matches_splitlines(tmp_path, monkeypatch):
+    from fabprint.gcode import _read_head_tail
+
+    monkeypatch.setattr("fabprint.gcode._READ_BLOCK", 64)
+    text = "".join(f"line {i} {'x' * (i % 17)}\n" for i in range(1000))
+    path = tmp_path / "lines.gcode"
+    path.write_text(text)
+    lines = text.splitlines()
+    assert _read_head_tail(path, 300, 50) == (lines[:300], lines[-50:])
+
+
 # --- analyze_gcode ---
 
 
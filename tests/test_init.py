@@ -17,6 +17,9 @@ from fabprint.init import (
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
+# Fixture paths as forward-slash strings (avoids TOML backslash escaping on Windows)
+CUBE_POSIX = (FIXTURES / "cube_10mm.stl").as_posix()
+
 
 def _posix(p: Path) -> str:
     return p.as_posix()
@@ -31,7 +34,7 @@ engine = "orca"
 version = "2.3.1"
 
 [[parts]]
-file = "{_posix(FIXTURES / "cube_10mm.stl")}"
+file = "{CUBE_POSIX}"
 """)
     return toml
 
@@ -137,7 +140,7 @@ class TestValidate:
 engine = "orca"
 
 [[parts]]
-file = "{_posix(FIXTURES / "cube_10mm.stl")}"
+file = "{CUBE_POSIX}"
 """)
         warnings = validate_config(toml)
         assert any("version" in w for w in warnings)
@@ -171,7 +174,7 @@ file = "{_posix(abs_path.resolve())}"
         out = capsys.readouterr().out
         assert "OK" in out or "warning" in out
 
-    def test_cli_validate_missing_config(self, tmp_path, monkeypatch, capsys):
+    def test_cli_validate_missing_config(self, tmp_path, monkeypatch):
         monkeypatch.chdir(tmp_path)
         with pytest.raises(SystemExit) as exc_info:
             main(["validate"])
@@ -236,7 +239,7 @@ version = "2.3.1"
 size = [10, 10]
 
 [[parts]]
-file = "{_posix(FIXTURES / "cube_10mm.stl")}"
+file = "{CUBE_POSIX}"
 """)
         warnings = validate_config(toml)
         assert any("seems very small" in w for w in warnings)
@@ -252,7 +255,7 @@ version = "2.3.1"
 size = [2000, 2000]
 
 [[parts]]
-file = "{_posix(FIXTURES / "cube_10mm.stl")}"
+file = "{CUBE_POSIX}"
 """)
         warnings = validate_config(toml)
         assert any("seems very large" in w for w in warnings)
@@ -265,7 +268,7 @@ engine = "orca"
 version = "2.3.1"
 
 [[parts]]
-file = "{_posix(FIXTURES / "cube_10mm.stl")}"
+file = "{CUBE_POSIX}"
 
 [printer]
 name = "nonexistent-printer"
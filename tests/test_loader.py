@@ -47,30 +47,31 @@ def test_load_unsupported():
 
 def _make_painted_3mf(path, paint_colors):
     """Create a minimal 3MF file with paint_color attributes on triangles."""
-    # Export a simple mesh via trimesh to get valid 3MF structure
+    # Build the model XML for a box directly; no trimesh export round-trip
     mesh = trimesh.creation.box(extents=[10, 10, 10])
-    scene = trimesh.Scene()
-    scene.add_geometry(mesh, node_name="painted_part")
-    scene.export(str(path))
-
-    # Post-process to add paint_color attributes
     ns = "http://schemas.microsoft.com/3dmanufacturing/core/2015/02"
     ET.register_namespace("", ns)
-    with zipfile.ZipFile(path, "r") as zf:
-        model_xml = zf.read("3D/3dmodel.model")
-        other_files = {n: zf.read(n) for n in zf.namelist() if n != "3D/3dmodel.model"}
 
-    root = ET.fromstring(model_xml)
-    triangles = list(root.iter(f"{{{ns}}}triangle"))
-    for i, tri in enumerate(triangles):
+    model = ET.Element(f"{{{ns}}}model", attrib={"unit": "millimeter"})
+    resources = ET.SubElement(model, f"{{{ns}}}resources")
+    obj = ET.SubElement(resources, f"{{{ns}}}object", id="1", name="painted_part", type="model")
+    mesh_elem = ET.SubElement(obj, f"{{{ns}}}mesh")
+    verts_elem = ET.SubElement(mesh_elem, f"{{{ns}}}vertices")
+    for v in mesh.vertices:
+        ET.SubElement(verts_elem, f"{{{ns}}}vertex", x=str(v[0]), y=str(v[1]), z=str(v[2]))
+    tris_elem = ET.SubElement(mesh_elem, f"{{{ns}}}triangles")
+    for i, f in enumerate(mesh.faces):
+        tri = ET.SubElement(
+            tris_elem, f"{{{ns}}}triangle", v1=str(f[0]), v2=str(f[1]), v3=str(f[2])
+        )
         if i < len(paint_colors) and paint_colors[i] is not None:
             tri.set("paint_color", paint_colors[i])
+    build = ET.SubElement(model, f"{{{ns}}}build")
+    ET.SubElement(build, f"{{{ns}}}item", objectid="1")
 
-    new_xml = ET.tostring(root, encoding="unicode", xml_declaration=True)
-    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr("3D/3dmodel.model", new_xml)
-        for name, data in other_files.items():
-            zf.writestr(name, data)
+    xml_str = ET.tostring(model, encoding="unicode", xml_declaration=True)
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("3D/3dmodel.model", xml_str)
 
 
 def test_extract_paint_colors_painted_3mf(tmp_path):
@@ -137,7 +138,7 @@ def _make_multi_object_3mf(path, objects, transforms=None):
         ET.SubElement(build, f"{{{ns}}}item", **item_attrib)
 
     xml_str = ET.tostring(model, encoding="unicode", xml_declaration=True)
-    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(path, "w") as zf:
         zf.writestr("3D/3dmodel.model", xml_str)
 
 
@@ -301,7 +302,7 @@ class TestLoad3mfObjectsEdgeCases:
 
         path = tmp_path / "skip_nomesh.3mf"
         xml_str = ET.tostring(model, encoding="unicode", xml_declaration=True)
-        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        with zipfile.ZipFile(path, "w") as zf:
             zf.writestr("3D/3dmodel.model", xml_str)
 
         objects = load_3mf_objects(path)
@@ -333,7 +334,7 @@ class TestLoad3mfObjectsEdgeCases:
 
         path = tmp_path / "missing_ref.3mf"
         xml_str = ET.tostring(model, encoding="unicode", xml_declaration=True)
-        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        with zipfile.ZipFile(path, "w") as zf:
             zf.writestr("3D/3dmodel.model", xml_str)
 
         objects = load_3mf_objects(path)
@@ -364,7 +365,7 @@ class TestLoad3mfObjectsEdgeCases:
 
         path = tmp_path / "no_build.3mf"
         xml_str = ET.tostring(model, encoding="unicode", xml_declaration=True)
-        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        with zipfile.ZipFile(path, "w") as zf:
             zf.writestr("3D/3dmodel.model", xml_str)
 
         objects = load_3mf_objects(path)
@@ -384,7 +385,7 @@ class TestLoad3mfObjectsEdgeCases:
 
         path = tmp_path / "empty_objects.3mf"
         xml_str = ET.tostring(model, encoding="unicode", xml_declaration=True)
-        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        with zipfile.ZipFile(path, "w") as zf:
             zf.writestr("3D/3dmodel.model", xml_str)
 
         with pytest.raises(ValueError, match="No mesh objects found"):
@@ -413,7 +414,7 @@ class TestLoad3mfObjectsEdgeCases:
 
         path = tmp_path / "noname.3mf"
         xml_str = ET.tostring(model, encoding="unicode", xml_declaration=True)
-        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        with zipfile.ZipFile(path, "w") as zf:
             zf.writestr("3D/3dmodel.model", xml_str)
 
         objects = load_3mf_objects(path)
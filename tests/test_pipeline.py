@@ -10,6 +10,10 @@ from fabprint.pipeline import LoadedParts, ResolvedFilaments, format_summary, lo
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
+# Fixture paths as forward-slash strings (avoids TOML backslash escaping on Windows)
+CUBE_POSIX = (FIXTURES / "cube_10mm.stl").as_posix()
+CYL_POSIX = (FIXTURES / "cylinder_5x20mm.stl").as_posix()
+
 
 def _posix(p: Path) -> str:
     return p.as_posix()
@@ -26,12 +30,12 @@ padding = 5.0
 engine = "orca"
 
 [[parts]]
-file = "{_posix(FIXTURES / "cube_10mm.stl")}"
+file = "{CUBE_POSIX}"
 copies = 2
 orient = "flat"
 
 [[parts]]
-file = "{_posix(FIXTURES / "cylinder_5x20mm.stl")}"
+file = "{CYL_POSIX}"
 orient = "upright"
 """)
     return toml
@@ -437,7 +441,7 @@ class TestLoadPartsFileGroups:
 
         path_3mf = tmp_path / "multi.3mf"
         xml_str = ET.tostring(model, encoding="unicode", xml_declaration=True)
-        with zipfile.ZipFile(path_3mf, "w", zipfile.ZIP_DEFLATED) as zf:
+        with zipfile.ZipFile(path_3mf, "w") as zf:
             zf.writestr("3D/3dmodel.model", xml_str)
 
         toml = tmp_path / "fabprint.toml"
@@ -484,7 +488,7 @@ filaments = {{ body = 1, inlay = 2 }}
             tri.set("paint_color", "#FF0000")
 
         new_xml = ET.tostring(root, encoding="unicode", xml_declaration=True)
-        with zipfile.ZipFile(path_3mf, "w", zipfile.ZIP_DEFLATED) as zf:
+        with zipfile.ZipFile(path_3mf, "w") as zf:
             zf.writestr("3D/3dmodel.model", new_xml)
             for name, data in other_files.items():
                 zf.writestr(name, data)
@@ -534,7 +538,7 @@ orient = "flat"
 
         path_3mf = tmp_path / "multi.3mf"
         xml_str = ET.tostring(model, encoding="unicode", xml_declaration=True)
-        with zipfile.ZipFile(path_3mf, "w", zipfile.ZIP_DEFLATED) as zf:
+        with zipfile.ZipFile(path_3mf, "w") as zf:
             zf.writestr("3D/3dmodel.model", xml_str)
 
         toml = tmp_path / "fabprint.toml"
@@ -587,7 +591,7 @@ filament = 2
 
         path_3mf = tmp_path / "single_obj.3mf"
         xml_str = ET.tostring(model, encoding="unicode", xml_declaration=True)
-        with zipfile.ZipFile(path_3mf, "w", zipfile.ZIP_DEFLATED) as zf:
+        with zipfile.ZipFile(path_3mf, "w") as zf:
             zf.writestr("3D/3dmodel.model", xml_str)
 
         toml = tmp_path / "fabprint.toml"
@@ -635,7 +639,7 @@ filament = 1
 
         path_3mf = tmp_path / "obj.3mf"
         xml_str = ET.tostring(model, encoding="unicode", xml_declaration=True)
-        with zipfile.ZipFile(path_3mf, "w", zipfile.ZIP_DEFLATED) as zf:
+        with zipfile.ZipFile(path_3mf, "w") as zf:
             zf.writestr("3D/3dmodel.model", xml_str)
 
         toml = tmp_path / "fabprint.toml"
@@ -2,8 +2,8 @@
 
 import xml.etree.ElementTree as ET
 import zipfile
-from pathlib import Path
 
+import pytest
 import trimesh
 
 from fabprint.arrange import arrange
@@ -11,12 +11,10 @@ from fabprint.plate import _encode_paint_color, build_plate, export_plate
 
 NS_3MF = "http://schemas.microsoft.com/3dmanufacturing/core/2015/02"
 
-FIXTURES = Path(__file__).parent / "fixtures"
 
-
-def test_build_and_export_3mf(tmp_path):
-    m1 = trimesh.load(str(FIXTURES / "cube_10mm.stl"))
-    m2 = trimesh.load(str(FIXTURES / "cylinder_5x20mm.stl"))
+def test_build_and_export_3mf(tmp_path, cube_mesh, cylinder_mesh):
+    m1 = cube_mesh.copy()
+    m2 = cylinder_mesh.copy()
 
     placements = arrange([m1, m2], ["cube", "cylinder"], plate_size=(256, 256))
     scene = build_plate(placements)
@@ -53,8 +51,9 @@ def _read_3mf_xml(path):
         return ET.fromstring(zf.read("3D/3dmodel.model"))
 
 
-def test_export_filament_id_no_paint(tmp_path):
-    """Config-assigned filament_id does NOT inject paint_color (OrcaSlicer bug)."""
+@pytest.fixture(scope="module")
+def filament_id_3mf(tmp_path_factory):
+    """Two cubes assigned filaments 1 and 3, exported once for the module."""
     m1 = trimesh.creation.box(extents=[10, 10, 10])
     m2 = trimesh.creation.box(extents=[10, 10, 10])
     m1.metadata["filament_id"] = 1
@@ -63,10 +62,14 @@ def test_export_filament_id_no_paint(tmp_path):
     placements = arrange([m1, m2], ["part_a", "part_b"], plate_size=(256, 256))
     scene = build_plate(placements)
 
-    out = tmp_path / "plate.3mf"
+    out = tmp_path_factory.mktemp("plate") / "plate.3mf"
     export_plate(scene, out)
+    return out
 
-    root = _read_3mf_xml(out)
+
+def test_export_filament_id_no_paint(filament_id_3mf):
+    """Config-assigned filament_id does NOT inject paint_color (OrcaSlicer bug)."""
+    root = _read_3mf_xml(filament_id_3mf)
     tris = root.findall(f".//{{{NS_3MF}}}triangle")
     # No paint_color should be injected for config-assigned filaments
     assert all(t.get("paint_color") is None for t in tris)
@@ -75,21 +78,10 @@ def test_export_filament_id_no_paint(tmp_path):
     assert len(meta) == 0
 
 
-def test_export_injects_extruder_metadata(tmp_path):
+def test_export_injects_extruder_metadata(filament_id_3mf):
     """Per-object extruder metadata is injected into model_settings.config."""
-    m1 = trimesh.creation.box(extents=[10, 10, 10])
-    m2 = trimesh.creation.box(extents=[10, 10, 10])
-    m1.metadata["filament_id"] = 1
-    m2.metadata["filament_id"] = 3
-
-    placements = arrange([m1, m2], ["part_a", "part_b"], plate_size=(256, 256))
-    scene = build_plate(placements)
-
-    out = tmp_path / "plate.3mf"
-    export_plate(scene, out)
-
     # model_settings.config should exist with per-object extruder
-    with zipfile.ZipFile(out) as zf:
+    with zipfile.ZipFile(filament_id_3mf) as zf:
         ms = zf.read("Metadata/model_settings.config").decode()
 
     ms_root = ET.fromstring(ms)
@@ -105,7 +97,7 @@ def test_export_injects_extruder_metadata(tmp_path):
     assert meta1["extruder"] == "3"
 
     # Object IDs should match the 3dmodel.model
-    model_root = _read_3mf_xml(out)
+    model_root = _read_3mf_xml(filament_id_3mf)
     model_objects = model_root.findall(f".//{{{NS_3MF}}}object")
     assert objects[0].get("id") == model_objects[0].get("id")
     assert objects[1].get("id") == model_objects[1].get("id")
@@ -132,9 +124,7 @@ def test_export_preserves_paint_colors(tmp_path):
 
     # All triangles should have paint_color matching our input
     assert len(tris) == num_faces
-    for i, tri in enumerate(tris):
-        expected = "4" if i % 2 == 0 else "8"
-        assert tri.get("paint_color") == expected
+    assert [tri.get("paint_color") for tri in tris] == paint_colors
 
 
 def test_export_no_paint_skips_postprocess(tmp_path):
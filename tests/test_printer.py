@@ -1,5 +1,6 @@
 """Tests for printer module."""
 
+import hashlib
 from pathlib import Path
 from unittest.mock import patch
 
@@ -38,10 +39,10 @@ serial = "SN123"
     monkeypatch.delenv("BAMBU_ACCESS_CODE", raising=False)
     monkeypatch.delenv("BAMBU_SERIAL", raising=False)
     creds = load_printer_credentials("workshop")
-    assert creds["type"] == "bambu-lan"
-    assert creds["ip"] == "10.0.0.1"
-    assert creds["access_code"] == "abc"
-    assert creds["serial"] == "SN123"
+    assert creds.type == "bambu-lan"
+    assert creds.ip == "10.0.0.1"
+    assert creds.access_code == "abc"
+    assert creds.serial == "SN123"
 
 
 def test_load_credentials_env_overrides(tmp_path, monkeypatch):
@@ -60,9 +61,9 @@ serial = "SN123"
     monkeypatch.setenv("BAMBU_ACCESS_CODE", "override_code")
     monkeypatch.setenv("BAMBU_SERIAL", "OVERRIDE_SN")
     creds = load_printer_credentials("workshop")
-    assert creds["ip"] == "192.168.1.99"
-    assert creds["access_code"] == "override_code"
-    assert creds["serial"] == "OVERRIDE_SN"
+    assert creds.ip == "192.168.1.99"
+    assert creds.access_code == "override_code"
+    assert creds.serial == "OVERRIDE_SN"
 
 
 def test_load_credentials_no_name(monkeypatch):
@@ -70,8 +71,8 @@ def test_load_credentials_no_name(monkeypatch):
     monkeypatch.delenv("BAMBU_ACCESS_CODE", raising=False)
     monkeypatch.delenv("BAMBU_SERIAL", raising=False)
     creds = load_printer_credentials(None)
-    assert creds["type"] is None
-    assert creds["ip"] is None
+    assert creds.type is None
+    assert creds.ip is None
 
 
 def test_load_credentials_missing_file(tmp_path, monkeypatch):
@@ -98,7 +99,7 @@ ip = "10.0.0.1"
         load_printer_credentials("workshop")
 
 
-def test_send_print_lan_dry_run(tmp_path, monkeypatch, capsys):
+def test_send_print_lan_dry_run(tmp_path, monkeypatch):
     cred_path = _write_credentials(
         tmp_path,
         """
@@ -191,7 +192,7 @@ serial = "SN123"
     monkeypatch.setenv("FABPRINT_CREDENTIALS", str(cred_path))
     monkeypatch.delenv("BAMBU_PRINTER_IP", raising=False)
     config = PrinterConfig(name="workshop")
-    with pytest.raises(FabprintError, match="ip"):
+    with pytest.raises(FabprintError, match="ip.*BAMBU_PRINTER_IP"):
         send_print(Path("dummy.gcode"), config)
 
 
@@ -229,6 +230,26 @@ access_code = "abc"
         send_print(Path("dummy.gcode"), config)
 
 
+def test_send_print_lan_reports_all_missing_fields(tmp_path, monkeypatch):
+    cred_path = _write_credentials(
+        tmp_path,
+        """
+[printers.workshop]
+type = "bambu-lan"
+access_code = "abc"
+""",
+    )
+    monkeypatch.setenv("FABPRINT_CREDENTIALS", str(cred_path))
+    monkeypatch.delenv("BAMBU_PRINTER_IP", raising=False)
+    monkeypatch.delenv("BAMBU_SERIAL", raising=False)
+    config = PrinterConfig(name="workshop")
+    with pytest.raises(FabprintError) as exc_info:
+        send_print(Path("dummy.gcode"), config)
+    message = str(exc_info.value)
+    assert "ip (or BAMBU_PRINTER_IP), serial (or BAMBU_SERIAL)" in message
+    assert "access_code" not in message
+
+
 def test_send_print_no_type(tmp_path, monkeypatch):
     """Printer without type in credentials should error."""
     cred_path = _write_credentials(
@@ -327,14 +348,60 @@ def test_get_moonraker_status(monkeypatch):
         importlib.reload(fabprint.printer)
 
 
+def test_send_lan_dry_run_skips_sdk_import(tmp_path, monkeypatch):
+    """Dry-run returns before importing bambulabs-api."""
+    import sys
+
+    from fabprint.printer import _send_lan
+
+    monkeypatch.setitem(sys.modules, "bambulabs_api", None)  # import would fail
+    gcode = tmp_path / "test.gcode"
+    gcode.write_text("; test gcode")
+    _send_lan(gcode, ip="10.0.0.1", access_code="abc", serial="SN123", dry_run=True)
+
+    with pytest.raises(ImportError, match="bambulabs-api"):
+        _send_lan(gcode, ip="10.0.0.1", access_code="abc", serial="SN123")
+
+
+def test_wait_for_lan_status_returns_first_push():
+    """LAN status returns as soon as the first status push arrives."""
+    from unittest.mock import MagicMock
+
+    from fabprint.printer import _wait_for_lan_status
+
+    printer = MagicMock()
+    printer.get_device_status.side_effect = [None, {}, {"gcode_state": "IDLE"}]
+    with patch("fabprint.printer.time.sleep") as mock_sleep:
+        status = _wait_for_lan_status(printer, timeout=5.0)
+    assert status == {"gcode_state": "IDLE"}
+    assert mock_sleep.call_count == 2
+
+
+def test_wait_for_lan_status_times_out():
+    """LAN status gives up with an empty dict when nothing arrives."""
+    from unittest.mock import MagicMock
+
+    from fabprint.printer import _wait_for_lan_status
+
+    printer = MagicMock()
+    printer.get_device_status.return_value = None
+    assert _wait_for_lan_status(printer, timeout=0.0) == {}
+
+
 def test_resolve_status_printers_by_name(tmp_path, monkeypatch):
     """Test --printer flag resolves a single printer."""
     from fabprint.cli import _resolve_status_printers
+    from fabprint.credentials import PrinterCredentials
 
-    creds = {"type": "bambu-lan", "ip": "10.0.0.1"}
+    creds = PrinterCredentials(
+        type="bambu-lan", ip="10.0.0.1", access_code=None, serial=None, url=None, api_key=None
+    )
     result = _resolve_status_printers("workshop", None, lambda: {}, lambda name: creds)
     assert len(result) == 1
-    assert result[0] == ("workshop", creds)
+    name, status_creds = result[0]
+    assert name == "workshop"
+    assert status_creds["type"] == "bambu-lan"
+    assert status_creds["ip"] == "10.0.0.1"
 
 
 def test_resolve_status_printers_all(tmp_path, monkeypatch):
@@ -390,8 +457,11 @@ def test_wrap_gcode_3mf(tmp_path):
         assert "Metadata/model_settings.config" in names
         assert "Metadata/slice_info.config" in names
 
-        # Check gcode content is preserved
+        # Check gcode content is preserved, compressed, with a matching md5
         assert zf.read("Metadata/plate_1.gcode") == gcode.read_bytes()
+        assert zf.getinfo("Metadata/plate_1.gcode").compress_type == zipfile.ZIP_DEFLATED
+        expected_md5 = hashlib.md5(gcode.read_bytes()).hexdigest()
+        assert zf.read("Metadata/plate_1.gcode.md5").decode() == expected_md5
 
         # Check slice_info has correct stats
         slice_info = zf.read("Metadata/slice_info.config").decode()
@@ -399,6 +469,21 @@ def test_wrap_gcode_3mf(tmp_path):
         assert 'value="1.50"' in slice_info
 
 
+def test_wrap_gcode_3mf_uses_given_stats(tmp_path):
+    import zipfile
+
+    gcode = tmp_path / "test.gcode"
+    gcode.write_text("G28\n")
+    stats = {"print_time_secs": 90, "filament_g": 2.5}
+    with patch("fabprint.printer.parse_gcode_metadata") as mock_parse:
+        result = wrap_gcode_3mf(gcode, stats=stats)
+    mock_parse.assert_not_called()
+    with zipfile.ZipFile(result, "r") as zf:
+        slice_info = zf.read("Metadata/slice_info.config").decode()
+    assert 'value="90"' in slice_info
+    assert 'value="2.50"' in slice_info
+
+
 def test_wrap_gcode_3mf_custom_output(tmp_path):
     gcode = tmp_path / "test.gcode"
     gcode.write_text("G28\n")
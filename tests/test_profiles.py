@@ -1,13 +1,16 @@
 """Tests for profile discovery, resolution, and pinning."""
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 import pytest
 
 from fabprint.profiles import (
-    SYSTEM_DIRS,
     _resolve_profile_data_from_dir,
+    _save_profile_cache,
+    _write_profile_json,
     add_profile,
     detect_category,
     discover_profile_names,
@@ -16,9 +19,10 @@ from fabprint.profiles import (
     pin_profiles,
     resolve_profile,
     resolve_profile_data,
+    system_dir,
 )
 
-ORCA_SYSTEM = SYSTEM_DIRS.get("orca")
+ORCA_SYSTEM = system_dir("orca")
 
 
 def _has_orca():
@@ -70,11 +74,51 @@ def test_resolve_path_traversal_rejected():
         resolve_profile("../../etc/passwd", "orca", "machine")
 
 
+def test_system_dir_unknown_engine():
+    assert system_dir("cura") is None
+
+
 def test_discover_unknown_engine():
     with pytest.raises(ValueError, match="Unknown engine"):
         discover_profiles("cura")
 
 
+def test_discover_profiles_mtime_cache(tmp_path, monkeypatch):
+    base = tmp_path / "system"
+    machine_dir = base / "machine"
+    machine_dir.mkdir(parents=True)
+    (machine_dir / "P1S.json").write_text(json.dumps({"type": "machine"}))
+    monkeypatch.setattr("fabprint.profiles.system_dir", lambda engine: base)
+    monkeypatch.setattr("fabprint.profiles._PROFILE_CACHE_PATH", tmp_path / "cache.json")
+
+    first = discover_profiles("orca")
+    assert list(first["machine"]) == ["P1S"]
+
+    # Warm call is served from the cache without parsing any profile JSON
+    with patch("fabprint.profiles.json.load") as mock_load:
+        assert discover_profiles("orca") == first
+    mock_load.assert_not_called()
+
+    # A changed directory mtime invalidates the cache
+    (machine_dir / "X1C.json").write_text(json.dumps({"type": "machine"}))
+    os.utime(machine_dir, ns=(0, machine_dir.stat().st_mtime_ns + 1_000_000))
+    assert sorted(discover_profiles("orca")["machine"]) == ["P1S", "X1C"]
+
+
+def test_save_profile_cache_concurrent_writers_keep_all_entries(tmp_path, monkeypatch):
+    cache = tmp_path / "cache" / "profiles.json"
+    monkeypatch.setattr("fabprint.profiles._PROFILE_CACHE_PATH", cache)
+    bases = [tmp_path / f"system{i}" for i in range(8)]
+    result = {"machine": {"P1S": tmp_path / "P1S.json"}}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda base: _save_profile_cache(base, {"machine": 1}, result), bases))
+
+    saved = json.loads(cache.read_text())
+    assert sorted(saved) == sorted(str(b) for b in bases)
+    assert list(cache.parent.iterdir()) == [cache]  # no stray temp files
+
+
 @pytest.mark.skipif(not _has_orca(), reason="OrcaSlicer not installed")
 def test_pin_profiles(tmp_path):
     pinned = pin_profiles(
@@ -94,6 +138,19 @@ def test_pin_profiles(tmp_path):
         json.loads(p.read_text())
 
 
+def test_write_profile_json_uses_umask_mode(tmp_path):
+    """Pinned profiles are shared files, not owner-only like mkstemp output."""
+    dest = tmp_path / "p.json"
+    old_umask = os.umask(0o022)
+    try:
+        _write_profile_json(dest, {"name": "p"})
+    finally:
+        os.umask(old_umask)
+    assert dest.stat().st_mode & 0o777 == 0o644
+    assert json.loads(dest.read_text()) == {"name": "p"}
+    assert list(tmp_path.iterdir()) == [dest]
+
+
 def test_resolve_profile_data_flattens_inheritance(tmp_path):
     """Verify resolve_profile_data merges the full inheritance chain."""
     # Create a 2-level inheritance chain in a fake system dir
@@ -115,6 +172,104 @@ def test_resolve_profile_data_flattens_inheritance(tmp_path):
     assert "inherits" not in data
 
 
+def test_resolve_profile_data_results_are_independent(tmp_path):
+    """Mutating a result must not leak into later resolutions."""
+    cat_dir = tmp_path / "profiles" / "filament"
+    cat_dir.mkdir(parents=True)
+    cat_dir.joinpath("root.json").write_text(json.dumps({"nozzle_temperature": ["220"]}))
+    for leaf in ("a", "b"):
+        cat_dir.joinpath(f"{leaf}.json").write_text(json.dumps({"inherits": "root"}))
+
+    first = resolve_profile_data(str(cat_dir / "a.json"), "orca", "filament", tmp_path)
+    first["nozzle_temperature"].append("999")
+
+    # Memoized result for the same leaf, and a fresh merge sharing the parent
+    for leaf in ("a", "b"):
+        data = resolve_profile_data(str(cat_dir / f"{leaf}.json"), "orca", "filament", tmp_path)
+        assert data["nozzle_temperature"] == ["220"]
+
+
+def test_resolve_profile_data_falls_back_to_system_parent(tmp_path):
+    """Parents missing next to the leaf are looked up in the system dir."""
+    system = tmp_path / "system"
+    (system / "process").mkdir(parents=True)
+    (system / "process" / "root.json").write_text(json.dumps({"wall_loops": 2, "infill": "grid"}))
+    pinned = tmp_path / "project" / "profiles" / "process"
+    pinned.mkdir(parents=True)
+    (pinned / "leaf.json").write_text(json.dumps({"inherits": "root", "wall_loops": 4}))
+
+    with patch("fabprint.profiles.system_dir", return_value=system):
+        data = resolve_profile_data("leaf", "orca", "process", tmp_path / "project")
+    assert data == {"wall_loops": 4, "infill": "grid"}
+
+
+def test_resolve_profile_data_inheritance_cycle(tmp_path):
+    cat_dir = tmp_path / "profiles" / "process"
+    cat_dir.mkdir(parents=True)
+    (cat_dir / "a.json").write_text(json.dumps({"inherits": "b", "x": "a"}))
+    (cat_dir / "b.json").write_text(json.dumps({"inherits": "a", "x": "b", "y": "b"}))
+
+    data = resolve_profile_data("a", "orca", "process", tmp_path)
+    assert data == {"x": "a", "y": "b"}
+
+
+def test_resolve_profile_data_cache_invalidation(tmp_path):
+    """Cached results are reused until a file in the chain changes or appears."""
+    system = tmp_path / "system"
+    (system / "process").mkdir(parents=True)
+    (system / "process" / "root.json").write_text(json.dumps({"infill": "grid"}))
+    pinned = tmp_path / "project" / "profiles" / "process"
+    pinned.mkdir(parents=True)
+    (pinned / "leaf.json").write_text(json.dumps({"inherits": "root", "wall_loops": 4}))
+
+    with patch("fabprint.profiles.system_dir", return_value=system):
+        first = resolve_profile_data("leaf", "orca", "process", tmp_path / "project")
+        with patch("fabprint.profiles.json.load", side_effect=AssertionError("not cached")):
+            assert resolve_profile_data("leaf", "orca", "process", tmp_path / "project") == first
+
+        # Changing a parent invalidates
+        (system / "process" / "root.json").write_text(json.dumps({"infill": "gyroid!"}))
+        data = resolve_profile_data("leaf", "orca", "process", tmp_path / "project")
+        assert data["infill"] == "gyroid!"
+
+        # A sibling parent appearing shadows the system one
+        (pinned / "root.json").write_text(json.dumps({"infill": "honeycomb"}))
+        data = resolve_profile_data("leaf", "orca", "process", tmp_path / "project")
+        assert data["infill"] == "honeycomb"
+
+
+def test_resolve_profile_data_memoized_in_process(tmp_path):
+    """Repeat resolutions skip the disk cache and return independent copies."""
+    cat_dir = tmp_path / "profiles" / "process"
+    cat_dir.mkdir(parents=True)
+    (cat_dir / "fast.json").write_text(json.dumps({"wall_loops": "2"}))
+
+    first = resolve_profile_data("fast", "orca", "process", tmp_path)
+    first["wall_loops"] = "9"
+    with patch("fabprint.profiles.json.loads", side_effect=AssertionError("read disk cache")):
+        second = resolve_profile_data("fast", "orca", "process", tmp_path)
+    assert second == {"wall_loops": "2"}
+
+
+def test_resolve_profile_data_parses_shared_parent_once(tmp_path):
+    """Leaves sharing a parent reuse its parse; an edited parent is re-read."""
+    cat_dir = tmp_path / "profiles" / "filament"
+    cat_dir.mkdir(parents=True)
+    (cat_dir / "common.json").write_text(json.dumps({"temp": "200", "fan": "on"}))
+    (cat_dir / "pla.json").write_text(json.dumps({"inherits": "common", "temp": "210"}))
+    (cat_dir / "petg.json").write_text(json.dumps({"inherits": "common", "temp": "240"}))
+
+    with patch("fabprint.profiles.json.load", wraps=json.load) as mock_load:
+        pla = resolve_profile_data("pla", "orca", "filament", tmp_path)
+        petg = resolve_profile_data("petg", "orca", "filament", tmp_path)
+    assert pla == {"temp": "210", "fan": "on"}
+    assert petg == {"temp": "240", "fan": "on"}
+    assert mock_load.call_count == 3  # pla, common, petg
+
+    (cat_dir / "common.json").write_text(json.dumps({"temp": "200", "fan": "off!"}))
+    assert resolve_profile_data("pla", "orca", "filament", tmp_path)["fan"] == "off!"
+
+
 @pytest.mark.skipif(not _has_orca(), reason="OrcaSlicer not installed")
 def test_resolve_profile_data_real_process():
     """Verify real OrcaSlicer process profile resolves enable_support."""
@@ -406,6 +561,34 @@ def test_pin_profiles_docker_fallback(tmp_path):
     assert data["printer_model"] == "test"
 
 
+def test_pin_profiles_local_preserves_order(tmp_path):
+    """Concurrently pinned profiles come back in request order, fully flattened."""
+    system = tmp_path / "system"
+    fil_dir = system / "filament"
+    fil_dir.mkdir(parents=True)
+    (fil_dir / "base.json").write_text(json.dumps({"filament_type": ["PLA"]}))
+    for name in ("A", "B", "C"):
+        (fil_dir / f"{name}.json").write_text(
+            json.dumps({"inherits": "base", "filament_vendor": [name]})
+        )
+    project = tmp_path / "project"
+    project.mkdir()
+
+    with patch("fabprint.profiles.system_dir", return_value=system):
+        pinned = pin_profiles(
+            engine="orca",
+            printer=None,
+            process=None,
+            filaments=["C", "A", "B", "A"],
+            project_dir=project,
+        )
+
+    assert [p.stem for p in pinned] == ["C", "A", "B", "A"]
+    data = json.loads(pinned[0].read_text())
+    assert data == {"filament_type": ["PLA"], "filament_vendor": ["C"]}
+    assert not list((project / "profiles" / "filament").glob("*.tmp"))
+
+
 def test_pin_profiles_no_docker_version_raises(tmp_path):
     """Without docker_version, missing profiles raise FabprintError."""
     project = tmp_path / "project"
@@ -1,26 +1,61 @@
 """Tests for slicer module."""
 
-from pathlib import Path
+import io
+import json
+import logging
+import subprocess
+import sys
+import tarfile
+import threading
+import time
+import zipfile
+from pathlib import Path, PurePosixPath
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from fabprint.slicer import (
+    _BC_DEFAULT_KEYS,
+    _DOCKER_IMAGES_PRESENT,
     SLICER_PATHS,
+    SliceJob,
     _apply_overrides,
+    _detect_slicer_version,
+    _docker_cli_available,
     _docker_image,
+    _ensure_docker_image,
+    _fix_sliced_3mf,
     _has_docker_image,
+    _patch_project_settings,
+    _prefetch_profiles,
+    _resolve_profiles,
+    _run_slicer,
     _slice_via_docker,
+    _write_tmp_profiles,
     find_slicer,
     parse_gcode_stats,
     slice_plate,
+    slice_plates,
 )
 
 # --- find_slicer ---
 
 
+@pytest.fixture(autouse=True)
+def _clear_slicer_caches():
+    find_slicer.cache_clear()
+    _detect_slicer_version.cache_clear()
+    _docker_cli_available.cache_clear()
+    _DOCKER_IMAGES_PRESENT.clear()
+    yield
+    find_slicer.cache_clear()
+    _detect_slicer_version.cache_clear()
+    _docker_cli_available.cache_clear()
+    _DOCKER_IMAGES_PRESENT.clear()
+
+
 def test_find_orca():
-    if not SLICER_PATHS["orca"].exists():
+    if not SLICER_PATHS["orca"].is_file():
         pytest.skip("OrcaSlicer not installed")
     assert find_slicer("orca") == SLICER_PATHS["orca"]
 
@@ -38,6 +73,13 @@ def test_find_slicer_path_fallback():
             assert result == Path("/usr/local/bin/orca-slicer")
 
 
+def test_find_slicer_default_path_directory_ignored(tmp_path):
+    """A directory at the default path is not taken for the executable."""
+    with patch.dict("fabprint.slicer.SLICER_PATHS", {"orca": tmp_path}):
+        with patch("fabprint.slicer.shutil.which", return_value="/usr/local/bin/orca-slicer"):
+            assert find_slicer("orca") == Path("/usr/local/bin/orca-slicer")
+
+
 def test_find_slicer_not_found():
     """Raises FileNotFoundError when slicer not at default path or on PATH."""
     with patch.dict("fabprint.slicer.SLICER_PATHS", {"orca": Path("/nonexistent/orca")}):
@@ -46,6 +88,32 @@ def test_find_slicer_not_found():
                 find_slicer("orca")
 
 
+def test_find_slicer_env_override(tmp_path, monkeypatch):
+    """FABPRINT_ORCA_PATH takes precedence over the default path and PATH."""
+    exe = tmp_path / "orca-slicer"
+    exe.touch()
+    monkeypatch.setenv("FABPRINT_ORCA_PATH", str(exe))
+    with patch("fabprint.slicer.shutil.which") as mock_which:
+        assert find_slicer("orca") == exe
+    mock_which.assert_not_called()
+
+
+def test_find_slicer_env_override_missing(tmp_path, monkeypatch):
+    monkeypatch.setenv("FABPRINT_ORCA_PATH", str(tmp_path / "nope"))
+    with pytest.raises(FileNotFoundError, match="FABPRINT_ORCA_PATH"):
+        find_slicer("orca")
+
+
+def test_find_slicer_cached():
+    """Repeated lookups for the same engine don't rescan PATH."""
+    with patch.dict("fabprint.slicer.SLICER_PATHS", {"orca": Path("/nonexistent/orca")}):
+        with patch(
+            "fabprint.slicer.shutil.which", return_value="/usr/local/bin/orca-slicer"
+        ) as mock_which:
+            assert find_slicer("orca") == find_slicer("orca")
+            assert mock_which.call_count == 1
+
+
 # --- _apply_overrides ---
 
 
@@ -67,7 +135,44 @@ def test_apply_overrides():
     assert result["wall_loops"] == "4"
     assert result["sparse_infill_density"] == "25%"
     assert result["other_setting"] == "keep"
-    assert result is data  # modifies in place
+    # Returns a new dict; the resolved profile is left as-is
+    assert result is not data
+    assert data["wall_loops"] == "2"
+
+
+# --- _detect_slicer_version ---
+
+
+def test_detect_slicer_version_cached():
+    """The slicer is only launched once per path to read its version."""
+    mock_proc = MagicMock()
+    mock_proc.stdout.readline.side_effect = [b"OrcaSlicer-2.3.1: usage\n"]
+    with patch("fabprint.slicer.subprocess.Popen", return_value=mock_proc) as mock_popen:
+        assert _detect_slicer_version(Path("/usr/bin/orca-slicer")) == "2.3.1"
+        assert _detect_slicer_version(Path("/usr/bin/orca-slicer")) == "2.3.1"
+        assert mock_popen.call_count == 1
+    mock_proc.kill.assert_called_once()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs an executable script")
+def test_detect_slicer_version_stops_reading_early(tmp_path):
+    """The slicer is killed once the version line is seen, not left to finish."""
+    slicer = tmp_path / "orca-slicer"
+    slicer.write_text(
+        f"#!{sys.executable}\n"
+        "import time\n"
+        "print('banner', flush=True)\n"
+        "print('OrcaSlicer-2.3.1:', flush=True)\n"
+        "time.sleep(30)\n"
+    )
+    slicer.chmod(0o755)
+    start = time.monotonic()
+    assert _detect_slicer_version(slicer) == "2.3.1"
+    assert time.monotonic() - start < 10
+
+
+def test_detect_slicer_version_missing_binary(tmp_path):
+    assert _detect_slicer_version(tmp_path / "nope") is None
 
 
 # --- _docker_image ---
@@ -107,6 +212,30 @@ def test_has_docker_image_false_no_docker():
         assert _has_docker_image("fabprint:orca-2.3.1") is False
 
 
+def test_has_docker_image_cached():
+    """A present image is only inspected once; a missing one is rechecked."""
+    with patch("fabprint.slicer.subprocess.run", return_value=MagicMock(returncode=0)) as run:
+        assert _has_docker_image("fabprint:orca-2.3.1") is True
+        assert _has_docker_image("fabprint:orca-2.3.1") is True
+        assert run.call_count == 1
+    with patch("fabprint.slicer.subprocess.run", return_value=MagicMock(returncode=1)) as run:
+        assert _has_docker_image("fabprint:orca-2.3.2") is False
+        assert _has_docker_image("fabprint:orca-2.3.2") is False
+        assert run.call_count == 2
+
+
+def test_ensure_docker_image_without_docker_cli():
+    """No docker CLI: no subprocesses, and the PATH lookup happens once."""
+    with (
+        patch("fabprint.slicer.shutil.which", return_value=None) as mock_which,
+        patch("fabprint.slicer.subprocess.run") as mock_run,
+    ):
+        assert _ensure_docker_image("fabprint:orca-2.3.1") is False
+        assert _ensure_docker_image("fabprint:orca-2.3.1") is False
+    mock_run.assert_not_called()
+    assert mock_which.call_count == 1
+
+
 # --- _slice_via_docker ---
 
 
@@ -121,11 +250,10 @@ def test_slice_via_docker_command(tmp_path):
     (profile_dir / "machine.json").write_text("{}")
     (profile_dir / "process.json").write_text("{}")
 
-    settings_arg = f"{profile_dir}/machine.json;{profile_dir}/process.json"
+    settings_arg = "/tmp/fabprint-profiles/machine.json;/tmp/fabprint-profiles/process.json"
     filament_arg = None
 
-    mock_result = MagicMock(returncode=0, stdout="", stderr="")
-    with patch("fabprint.slicer.subprocess.run", return_value=mock_result) as mock_run:
+    with patch("fabprint.slicer._run_slicer", return_value=(0, "")) as mock_run:
         _slice_via_docker(
             input_3mf,
             output_dir,
@@ -142,11 +270,15 @@ def test_slice_via_docker_command(tmp_path):
     assert "fabprint:orca-2.3.1" in cmd
     assert "--entrypoint" in cmd
     assert "orca-slicer" in cmd
-    # Verify profile paths rewritten to container paths under /work/output/
+    # Container profile paths are passed through as-is
     settings_idx = cmd.index("--load-settings") + 1
-    assert "/work/output/.profiles/machine.json" in cmd[settings_idx]
-    assert "/work/output/.profiles/process.json" in cmd[settings_idx]
-    assert str(profile_dir) not in cmd[settings_idx]
+    assert cmd[settings_idx] == settings_arg
+    # Profiles are streamed in memory rather than mounted
+    assert "-i" in cmd
+    assert not any(".profiles" in arg for arg in cmd)
+    with tarfile.open(fileobj=io.BytesIO(mock_run.call_args.kwargs["input"])) as tar:
+        assert sorted(tar.getnames()) == ["machine.json", "process.json"]
+        assert tar.extractfile("machine.json").read() == b"{}"
 
 
 def test_slice_via_docker_failure(tmp_path):
@@ -158,9 +290,8 @@ def test_slice_via_docker_failure(tmp_path):
     profile_dir = output_dir / ".profiles"
     profile_dir.mkdir()
 
-    mock_result = MagicMock(returncode=1, stdout="", stderr="some error")
-    with patch("fabprint.slicer.subprocess.run", return_value=mock_result):
-        with pytest.raises(RuntimeError, match="Docker slicer failed"):
+    with patch("fabprint.slicer._run_slicer", return_value=(1, "some error")):
+        with pytest.raises(RuntimeError, match="Docker slicer failed.*\n.*some error"):
             _slice_via_docker(
                 input_3mf,
                 output_dir,
@@ -171,6 +302,147 @@ def test_slice_via_docker_failure(tmp_path):
             )
 
 
+# --- _run_slicer ---
+
+
+def test_run_slicer_streams_stdout_and_keeps_stderr_tail(caplog, monkeypatch):
+    monkeypatch.setattr("fabprint.slicer._STDERR_TAIL_LINES", 3)
+    script = (
+        "import sys\n"
+        "data = sys.stdin.read()\n"
+        "print('got', data)\n"
+        "for i in range(10): print('err', i, file=sys.stderr)\n"
+        "sys.exit(2)\n"
+    )
+    with caplog.at_level(logging.INFO, logger="fabprint.slicer"):
+        returncode, stderr = _run_slicer(
+            [sys.executable, "-c", script], 30, "Slicer", input=b"payload"
+        )
+
+    assert returncode == 2
+    assert stderr == "err 7\nerr 8\nerr 9"
+    assert "Slicer: got payload" in caplog.text
+    assert "stderr" not in caplog.text
+
+
+def test_run_slicer_logs_stderr_when_debugging(caplog):
+    script = "import sys; print('warming up', file=sys.stderr)"
+    with caplog.at_level(logging.DEBUG, logger="fabprint.slicer"):
+        _run_slicer([sys.executable, "-c", script], 30, "Slicer")
+
+    assert "Slicer stderr: warming up" in caplog.text
+
+
+def test_run_slicer_discards_stdout_when_quiet(caplog):
+    script = "import sys; print('progress'); print('oops', file=sys.stderr); sys.exit(1)"
+    with (
+        caplog.at_level(logging.WARNING, logger="fabprint.slicer"),
+        patch("fabprint.slicer.subprocess.Popen", wraps=subprocess.Popen) as mock_popen,
+    ):
+        returncode, stderr = _run_slicer([sys.executable, "-c", script], 30, "Slicer")
+
+    assert mock_popen.call_args.kwargs["stdout"] == subprocess.DEVNULL
+    assert returncode == 1
+    assert stderr == "oops"
+    assert "progress" not in caplog.text
+
+
+def test_run_slicer_timeout_kills():
+    with pytest.raises(subprocess.TimeoutExpired):
+        _run_slicer([sys.executable, "-c", "import time; time.sleep(30)"], 0.5, "Slicer")
+
+
+# --- _resolve_profiles ---
+
+
+def test_prefetch_profiles_resolves_each_and_ignores_errors():
+    def _resolve(name, engine, category, project_dir=None):
+        if name == "Missing":
+            raise FileNotFoundError(name)
+        return {}
+
+    with patch("fabprint.slicer.resolve_profile_data", side_effect=_resolve) as mock:
+        _prefetch_profiles("orca", "Missing", "Standard", ["PLA", "", "PLA"], None)
+
+    assert [c.args[:3] for c in mock.call_args_list] == [
+        ("Missing", "orca", "machine"),
+        ("Standard", "orca", "process"),
+        ("PLA", "orca", "filament"),
+    ]
+
+
+def test_resolve_profiles_writes_all_and_fills_gaps(tmp_path):
+    with patch("fabprint.slicer.resolve_profile_data", side_effect=_mock_resolve):
+        settings_arg, filament_arg = _resolve_profiles(
+            "orca", "P1S", "Standard", ["", "PLA", "", "PETG"], None, None, tmp_path
+        )
+
+    machine, process = settings_arg.split(";")
+    assert json.loads(Path(machine).read_text())["name"] == "P1S"
+    assert json.loads(Path(process).read_text())["name"] == "Standard"
+    slots = filament_arg.split(";")
+    assert slots[0] == slots[1] == slots[2] != slots[3]
+    assert Path(slots[0]).name.startswith("filament_1-")
+    assert Path(slots[3]).name.startswith("filament_3-")
+    assert json.loads(Path(slots[3]).read_text())["name"] == "PETG"
+
+
+def test_resolve_profiles_path_prefix(tmp_path):
+    """With a path prefix, args point where the files appear in the container."""
+    with patch("fabprint.slicer.resolve_profile_data", side_effect=_mock_resolve):
+        settings_arg, filament_arg = _resolve_profiles(
+            "orca", "P1S", "Standard", ["PLA", ""], None, None, tmp_path, path_prefix="/work/p"
+        )
+
+    machine, process = settings_arg.split(";")
+    assert machine.startswith("/work/p/machine-") and process.startswith("/work/p/process-")
+    first, gap = filament_arg.split(";")
+    assert first == gap and first.startswith("/work/p/filament_0-")
+    assert (tmp_path / PurePosixPath(machine).name).exists()
+
+
+def test_write_tmp_profiles_reuses_identical_files(tmp_path):
+    first = _write_tmp_profiles({"process": {"a": "1"}}, tmp_path)["process"]
+    mtime = first.stat().st_mtime_ns
+    again = _write_tmp_profiles({"process": {"a": "1"}}, tmp_path)["process"]
+    changed = _write_tmp_profiles({"process": {"a": "2"}}, tmp_path)["process"]
+
+    assert again == first and first.stat().st_mtime_ns == mtime
+    assert changed != first
+    assert json.loads(changed.read_text()) == {"a": "2"}
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_write_tmp_profiles_compact_unless_debugging(tmp_path, caplog):
+    compact = _write_tmp_profiles({"process": {"a": "1"}}, tmp_path)["process"]
+    with caplog.at_level(logging.DEBUG, logger="fabprint.slicer"):
+        indented = _write_tmp_profiles({"process": {"a": "1"}}, tmp_path)["process"]
+
+    assert compact.read_text() == '{"a":"1"}'
+    assert indented.read_text() == '{\n    "a": "1"\n}'
+
+
+def test_resolve_profiles_owner_only_files(tmp_path):
+    with patch("fabprint.slicer.resolve_profile_data", side_effect=_mock_resolve):
+        settings_arg, _ = _resolve_profiles("orca", "P1S", None, None, None, None, tmp_path)
+    if sys.platform != "win32":
+        assert Path(settings_arg).stat().st_mode & 0o777 == 0o600
+
+
+def test_resolve_profiles_dedupes_filaments(tmp_path):
+    """Repeated filament names are only resolved once."""
+    with patch("fabprint.slicer.resolve_profile_data", side_effect=_mock_resolve) as mock:
+        _, filament_arg = _resolve_profiles(
+            "orca", None, None, ["PLA", "PETG", "PLA"], None, None, tmp_path
+        )
+
+    assert sorted(c.args[0] for c in mock.call_args_list) == ["PETG", "PLA"]
+    first, second, third = filament_arg.split(";")
+    # The repeated filament shares one file
+    assert first == third != second
+    assert len(list(tmp_path.glob("filament_*.json"))) == 2
+
+
 # --- slice_plate integration ---
 
 
@@ -185,13 +457,12 @@ def test_slice_plate_local_command(tmp_path):
     input_3mf.write_text("fake")
     output_dir = tmp_path / "output"
 
-    mock_result = MagicMock(returncode=0, stdout="", stderr="")
     slicer_path = Path("/usr/bin/orca-slicer")
 
     with (
         patch("fabprint.slicer.find_slicer", return_value=slicer_path),
         patch("fabprint.slicer.resolve_profile_data", side_effect=_mock_resolve),
-        patch("fabprint.slicer.subprocess.run", return_value=mock_result) as mock_run,
+        patch("fabprint.slicer._run_slicer", return_value=(0, "")) as mock_run,
     ):
         slice_plate(
             input_3mf,
@@ -212,20 +483,33 @@ def test_slice_plate_local_command(tmp_path):
     assert str(output_dir) in cmd
 
 
+def test_slice_plate_local_skips_version_probe_without_required_version(tmp_path):
+    input_3mf = tmp_path / "plate.3mf"
+    input_3mf.write_text("fake")
+
+    with (
+        patch("fabprint.slicer.find_slicer", return_value=Path("/usr/bin/orca-slicer")),
+        patch("fabprint.slicer._detect_slicer_version") as mock_detect,
+        patch("fabprint.slicer._run_slicer", return_value=(0, "")),
+    ):
+        slice_plate(input_3mf, output_dir=tmp_path / "output", local=True)
+
+    mock_detect.assert_not_called()
+
+
 def test_slice_plate_local_fallback(tmp_path):
     """When Docker image not found, falls back to local slicer."""
     input_3mf = tmp_path / "plate.3mf"
     input_3mf.write_text("fake")
     output_dir = tmp_path / "output"
 
-    mock_result = MagicMock(returncode=0, stdout="", stderr="")
     slicer_path = Path("/usr/bin/orca-slicer")
 
     with (
         patch("fabprint.slicer._ensure_docker_image", return_value=False),
         patch("fabprint.slicer.find_slicer", return_value=slicer_path),
         patch("fabprint.slicer.resolve_profile_data", side_effect=_mock_resolve),
-        patch("fabprint.slicer.subprocess.run", return_value=mock_result) as mock_run,
+        patch("fabprint.slicer._run_slicer", return_value=(0, "")) as mock_run,
     ):
         slice_plate(
             input_3mf,
@@ -244,12 +528,10 @@ def test_slice_plate_docker_default(tmp_path):
     input_3mf.write_text("fake")
     output_dir = tmp_path / "output"
 
-    mock_result = MagicMock(returncode=0, stdout="", stderr="")
-
     with (
         patch("fabprint.slicer._ensure_docker_image", return_value=True),
         patch("fabprint.slicer.resolve_profile_data", side_effect=_mock_resolve),
-        patch("fabprint.slicer.subprocess.run", return_value=mock_result) as mock_run,
+        patch("fabprint.slicer._run_slicer", return_value=(0, "")) as mock_run,
     ):
         slice_plate(
             input_3mf,
@@ -261,6 +543,43 @@ def test_slice_plate_docker_default(tmp_path):
     cmd = mock_run.call_args[0][0]
     assert cmd[0] == "docker"
     assert "fabprint/fabprint:latest" in cmd
+    assert cmd[cmd.index("--load-settings") + 1].startswith("/tmp/fabprint-profiles/machine-")
+
+
+def test_slice_plate_docker_profiles_writable_by_image_user(tmp_path):
+    """Profiles unpack where the image's non-root user can create directories.
+
+    The fabprint image runs as USER fabprint, and /work is created root-owned
+    by Docker for the bind mounts, so only /tmp (or the /work/output mount)
+    is writable.
+    """
+    input_3mf = tmp_path / "plate.3mf"
+    input_3mf.write_text("fake")
+
+    with (
+        patch("fabprint.slicer._ensure_docker_image", return_value=True),
+        patch("fabprint.slicer.resolve_profile_data", side_effect=_mock_resolve),
+        patch("fabprint.slicer._run_slicer", return_value=(0, "")) as mock_run,
+    ):
+        slice_plate(
+            input_3mf,
+            output_dir=tmp_path / "output",
+            printer="My Printer",
+            filaments=["PLA", "PETG"],
+        )
+
+    cmd = mock_run.call_args[0][0]
+    paths = [
+        PurePosixPath(p)
+        for flag in ("--load-settings", "--load-filaments")
+        for p in cmd[cmd.index(flag) + 1].split(";")
+    ]
+    writable = (PurePosixPath("/tmp"), PurePosixPath("/work/output"))
+    for path in paths:
+        assert any(path.parent.is_relative_to(root) and path.parent != root for root in writable)
+    # The entrypoint creates exactly the directory the args point into
+    script = cmd[cmd.index("-c") + 1]
+    assert f"mkdir -p {paths[0].parent} " in script
 
 
 def test_slice_plate_docker_version(tmp_path):
@@ -269,12 +588,10 @@ def test_slice_plate_docker_version(tmp_path):
     input_3mf.write_text("fake")
     output_dir = tmp_path / "output"
 
-    mock_result = MagicMock(returncode=0, stdout="", stderr="")
-
     with (
         patch("fabprint.slicer._ensure_docker_image", return_value=True),
         patch("fabprint.slicer.resolve_profile_data", side_effect=_mock_resolve),
-        patch("fabprint.slicer.subprocess.run", return_value=mock_result) as mock_run,
+        patch("fabprint.slicer._run_slicer", return_value=(0, "")) as mock_run,
     ):
         slice_plate(
             input_3mf,
@@ -348,7 +665,225 @@ def test_parse_gcode_stats_empty(tmp_path):
     assert parse_gcode_stats(tmp_path) == {}
 
 
+def test_parse_gcode_stats_missing_dir(tmp_path):
+    assert parse_gcode_stats(tmp_path / "nope") == {}
+
+
 def test_parse_gcode_stats_no_metadata(tmp_path):
     gcode = tmp_path / "plate.gcode"
     gcode.write_text("G28 ; home\nG1 X10 Y10\n")
     assert parse_gcode_stats(tmp_path) == {}
+
+
+# --- _fix_sliced_3mf ---
+
+
+def _make_sliced_3mf(path: Path, gcode: bytes) -> None:
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("Metadata/project_settings.config", json.dumps({"filament_type": ["PLA"]}))
+        z.writestr(
+            "Metadata/model_settings.config",
+            "<config>\n  <plate>\n"
+            '    <metadata key="filament_maps" value="1"/>\n'
+            "  </plate>\n</config>",
+        )
+        z.writestr("Metadata/plate_1.gcode", gcode)
+        z.writestr("3D/3dmodel.model", "<model/>", compress_type=zipfile.ZIP_STORED)
+
+
+def test_fix_sliced_3mf_patches_and_preserves_members(tmp_path):
+    path = tmp_path / "plate_sliced.gcode.3mf"
+    gcode = b"G1 X1 Y1\n" * 5000
+    _make_sliced_3mf(path, gcode)
+    with zipfile.ZipFile(path) as z:
+        before = {i.filename: (i.compress_type, i.compress_size) for i in z.infolist()}
+
+    _fix_sliced_3mf(path)
+
+    with zipfile.ZipFile(path) as z:
+        assert z.testzip() is None
+        assert z.read("Metadata/plate_1.gcode") == gcode
+        assert z.read("3D/3dmodel.model") == b"<model/>"
+        # Untouched members keep their original compressed payload
+        for name in ("Metadata/plate_1.gcode", "3D/3dmodel.model"):
+            info = z.getinfo(name)
+            assert (info.compress_type, info.compress_size) == before[name]
+        ps = json.loads(z.read("Metadata/project_settings.config"))
+        assert ps["filament_type"] == ["PLA"] * 5
+        ms = z.read("Metadata/model_settings.config").decode()
+        assert 'key="filament_maps" value="1 1 1 1 1"' in ms
+        assert 'key="thumbnail_file"' in ms
+        assert z.read("Metadata/plate_1.png")[:8] == b"\x89PNG\r\n\x1a\n"
+        assert z.getinfo("Metadata/plate_1.png").compress_type == zipfile.ZIP_STORED
+
+
+def test_fix_sliced_3mf_copies_large_members_in_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr("fabprint.slicer._ZIP_COPY_BLOCK", 64)
+    path = tmp_path / "plate_sliced.gcode.3mf"
+    gcode = bytes(range(256)) * 200  # still several 64-byte chunks once deflated
+    _make_sliced_3mf(path, gcode)
+
+    _fix_sliced_3mf(path)
+
+    with zipfile.ZipFile(path) as z:
+        assert z.testzip() is None
+        assert z.read("Metadata/plate_1.gcode") == gcode
+
+
+def test_patch_project_settings_splices_missing_keys():
+    raw = json.dumps({"filament_type": ["PLA"] * 5, "layer_height": "0.2"}, indent=4).encode()
+    patched = _patch_project_settings(raw)
+
+    assert patched is not None
+    assert patched.startswith(raw[: raw.rindex(b"}")].rstrip())
+    ps = json.loads(patched)
+    assert ps["layer_height"] == "0.2"
+    assert ps["filament_retract_lift_above"] == ["0"] * 5
+    assert ps["host_type"] == "octoprint"
+
+
+def test_patch_project_settings_noop_when_complete():
+    ps = json.loads(_patch_project_settings(b"{}"))
+    assert ps["filament_retract_lift_enforce"] == [""] * 5
+    assert ps.keys() == _BC_DEFAULT_KEYS.keys()
+    assert _patch_project_settings(json.dumps(ps).encode()) is None
+
+
+def test_fix_sliced_3mf_skips_compatible_file(tmp_path):
+    path = tmp_path / "plate_sliced.gcode.3mf"
+    _make_sliced_3mf(path, b"G1 X1 Y1\n")
+    _fix_sliced_3mf(path)
+    patched = path.read_bytes()
+    mtime = path.stat().st_mtime_ns
+
+    _fix_sliced_3mf(path)
+
+    assert path.read_bytes() == patched
+    assert path.stat().st_mtime_ns == mtime
+
+
+def test_fix_sliced_3mf_missing_file(tmp_path):
+    _fix_sliced_3mf(tmp_path / "missing.gcode.3mf")  # no error
+
+
+# --- slice_plates ---
+
+
+def test_slice_plates_runs_jobs_concurrently_in_order(tmp_path):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _slice(input_3mf, **kwargs):
+        barrier.wait()  # deadlocks (times out) unless both jobs run at once
+        return kwargs["output_dir"]
+
+    jobs = [
+        SliceJob(tmp_path / "a.3mf", output_dir=tmp_path / "out_a", printer="P1S"),
+        SliceJob(tmp_path / "b.3mf", output_dir=tmp_path / "out_b", printer="P1S"),
+    ]
+    with patch("fabprint.slicer.slice_plate", side_effect=_slice) as mock_slice:
+        assert slice_plates(jobs, max_workers=2) == [tmp_path / "out_a", tmp_path / "out_b"]
+    assert mock_slice.call_args.kwargs["printer"] == "P1S"
+
+
+def test_slice_plates_raises_job_error(tmp_path):
+    def _slice(input_3mf, **kwargs):
+        if input_3mf.name == "bad.3mf":
+            raise RuntimeError("Slicer failed")
+        return tmp_path
+
+    jobs = [SliceJob(tmp_path / "good.3mf"), SliceJob(tmp_path / "bad.3mf")]
+    with (
+        patch("fabprint.slicer.slice_plate", side_effect=_slice),
+        pytest.raises(RuntimeError, match="Slicer failed"),
+    ):
+        slice_plates(jobs)
+
+
+def test_slice_plates_empty():
+    assert slice_plates([]) == []
+
+
+# --- slice cache ---
+
+
+def _fake_slicer_run(cmd, timeout, label, input=None):
+    """Write what OrcaSlicer would: the sliced 3mf and a plate gcode."""
+    out = Path(cmd[cmd.index("--outputdir") + 1])
+    with zipfile.ZipFile(out / cmd[cmd.index("--export-3mf") + 1], "w") as z:
+        z.writestr("Metadata/plate_1.gcode", "G1 X1\n")
+    (out / "plate_1.gcode").write_text("; total estimated time: 1m\n")
+    return 0, ""
+
+
+def _slice_local(input_3mf, output_dir, **kwargs):
+    with (
+        patch("fabprint.slicer.find_slicer", return_value=Path("/usr/bin/orca-slicer")),
+        patch("fabprint.slicer.resolve_profile_data", side_effect=_mock_resolve),
+        patch("fabprint.slicer._run_slicer", side_effect=_fake_slicer_run) as mock_run,
+    ):
+        kwargs.setdefault("cache", True)
+        slice_plate(
+            input_3mf, output_dir=output_dir, printer="P1S", process="Std", local=True, **kwargs
+        )
+    return mock_run.call_count
+
+
+def test_slice_plate_cache_hit_restores_outputs(tmp_path):
+    input_3mf = tmp_path / "plate.3mf"
+    input_3mf.write_text("fake")
+    output_dir = tmp_path / "output"
+
+    assert _slice_local(input_3mf, output_dir) == 1
+    sliced = output_dir / "plate_sliced.gcode.3mf"
+    first = sliced.read_bytes()
+    sliced.unlink()
+    (output_dir / "plate_1.gcode").unlink()
+
+    assert _slice_local(input_3mf, output_dir) == 0
+    assert sliced.read_bytes() == first
+    assert (output_dir / "plate_1.gcode").read_text() == "; total estimated time: 1m\n"
+    assert (tmp_path / ".fabprint-cache").is_dir()
+
+
+def test_slice_plate_cache_misses_on_changed_inputs(tmp_path):
+    input_3mf = tmp_path / "plate.3mf"
+    input_3mf.write_text("fake")
+    output_dir = tmp_path / "output"
+
+    assert _slice_local(input_3mf, output_dir) == 1
+    assert _slice_local(input_3mf, output_dir, overrides={"wall_loops": 3}) == 1
+    input_3mf.write_text("changed")
+    assert _slice_local(input_3mf, output_dir) == 1
+    assert _slice_local(input_3mf, output_dir, cache=False) == 1
+
+
+def _write_plate_zip(path, date_time):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(zipfile.ZipInfo("3D/3dmodel.model", date_time), "<model/>")
+
+
+def test_slice_plate_cache_hits_across_exports_and_processes(tmp_path, monkeypatch):
+    """Re-exported plates and a fresh profile temp dir still hit the cache."""
+    input_3mf = tmp_path / "plate.3mf"
+    output_dir = tmp_path / "output"
+    _write_plate_zip(input_3mf, (2026, 1, 1, 0, 0, 0))
+    assert _slice_local(input_3mf, output_dir) == 1
+
+    # Same contents, new member timestamps (as a later export_plate writes)
+    _write_plate_zip(input_3mf, (2026, 1, 1, 0, 0, 2))
+    # As in a new process: profiles land in a different temp dir
+    monkeypatch.setattr("fabprint.slicer._PROFILE_BUNDLE_DIR", None)
+    assert _slice_local(input_3mf, output_dir) == 0
+
+
+def test_slice_plate_cache_off_by_default(tmp_path):
+    input_3mf = tmp_path / "plate.3mf"
+    input_3mf.write_text("fake")
+    output_dir = tmp_path / "output"
+
+    with (
+        patch("fabprint.slicer.find_slicer", return_value=Path("/usr/bin/orca-slicer")),
+        patch("fabprint.slicer._run_slicer", side_effect=_fake_slicer_run),
+    ):
+        slice_plate(input_3mf, output_dir=output_dir, local=True)
+    assert not (tmp_path / ".fabprint-cache").exists()
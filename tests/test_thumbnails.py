@@ -0,0 +1,65 @@
+"""Tests for thumbnail generation."""
+
+import struct
+import zlib
+
+from fabprint.thumbnails import generate_plate_thumbnail, placeholder_thumbnail
+
+
+def _decode_rgb(png: bytes) -> tuple[int, int, bytes]:
+    """Return (width, height, raw scanlines) for a single-IDAT RGB PNG."""
+    assert png[:8] == b"\x89PNG\r\n\x1a\n"
+    width, height = struct.unpack(">II", png[16:24])
+    idat_len = struct.unpack(">I", png[33:37])[0]
+    assert png[37:41] == b"IDAT"
+    return width, height, zlib.decompress(png[41 : 41 + idat_len])
+
+
+def test_placeholder_dimensions():
+    for w, h in [(256, 256), (128, 128), (30, 100)]:
+        width, height, raw = _decode_rgb(placeholder_thumbnail(w, h))
+        assert (width, height) == (w, h)
+        assert len(raw) == h * (w * 3 + 1)
+
+
+def test_placeholder_layout():
+    width, _, raw = _decode_rgb(placeholder_thumbnail(256, 256))
+    stride = width * 3 + 1
+
+    def pixel(x: int, y: int) -> tuple[int, ...]:
+        off = y * stride + 1 + x * 3
+        return tuple(raw[off : off + 3])
+
+    assert pixel(0, 0) == (25, 25, 30)  # background
+    assert pixel(128, 40) == (0, 150, 136)  # accent band
+    assert pixel(30, 100) == (50, 52, 58)  # plate
+    # The text row contains accent pixels
+    assert any(pixel(x, 128) == (0, 150, 136) for x in range(width))
+
+
+def test_generate_without_plate_uses_placeholder():
+    assert generate_plate_thumbnail(64, 64) == placeholder_thumbnail(64, 64)
+
+
+def test_placeholder_cached():
+    assert placeholder_thumbnail(100, 100) is placeholder_thumbnail(100, 100)
+
+
+def test_render_plate_thumbnail_shades_parts(tmp_path):
+    import io
+
+    import trimesh
+    from PIL import Image
+
+    plate = tmp_path / "plate.3mf"
+    scene = trimesh.Scene(trimesh.creation.box((40, 40, 20)))
+    plate.write_bytes(scene.export(file_type="3mf"))
+
+    png = generate_plate_thumbnail(128, 128, plate)
+
+    assert png != placeholder_thumbnail(128, 128)
+    img = Image.open(io.BytesIO(png)).convert("RGB")
+    assert img.size == (128, 128)
+    # The part's faces are drawn in (shaded) teal at the centre of the plate
+    r, g, b = img.getpixel((64, 64))
+    assert r < g and r < b
@@ -1,60 +1,110 @@
 """Tests for the viewer module."""
 
-from unittest.mock import patch
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
+import numpy as np
+import pytest
 import trimesh
 
-from fabprint.viewer import _make_plate_outline, _try_trimesh, show_plate
+from fabprint.viewer import (
+    _make_plate_outline,
+    _ocp_modules,
+    _try_ocp,
+    _try_trimesh,
+    _write_stl,
+    show_plate,
+)
+
+# Shared read-only part mesh; none of the viewer paths mutate their inputs
+CUBE = trimesh.creation.box(extents=[10, 10, 10])
 
 
 def test_make_plate_outline_dimensions():
     plate = _make_plate_outline((200, 300))
     # Should be a thin box centered on the plate
-    assert abs(plate.extents[0] - 200) < 0.1
-    assert abs(plate.extents[1] - 300) < 0.1
-    assert abs(plate.extents[2] - 0.5) < 0.1
+    assert plate.extents == pytest.approx((200, 300, 0.5), abs=0.1)
 
 
 def test_make_plate_outline_position():
     plate = _make_plate_outline((256, 256))
     # Center should be at (128, 128)
-    center = plate.centroid
-    assert abs(center[0] - 128) < 0.1
-    assert abs(center[1] - 128) < 0.1
+    assert plate.centroid[:2] == pytest.approx((128, 128), abs=0.1)
+
+
+def test_make_plate_outline_returns_independent_copies():
+    first = _make_plate_outline((220, 220))
+    first.visual.face_colors = [255, 0, 0, 255]
+    second = _make_plate_outline((220, 220))
+    assert second is not first
+    assert not np.array_equal(second.visual.face_colors[0], [255, 0, 0, 255])
 
 
 def test_try_trimesh_builds_scene():
-    mesh = trimesh.creation.box(extents=[10, 10, 10])
     with patch.object(trimesh.Scene, "show") as mock_show:
-        _try_trimesh([mesh], ["cube"], (256, 256))
+        _try_trimesh([CUBE], ["cube"], (256, 256))
         mock_show.assert_called_once()
 
 
 def test_try_trimesh_multiple_parts():
-    meshes = [trimesh.creation.box(extents=[10, 10, 10]) for _ in range(3)]
+    meshes = [CUBE] * 3
     names = ["a", "b", "c"]
     with patch.object(trimesh.Scene, "show") as mock_show:
         _try_trimesh(meshes, names, (256, 256))
         mock_show.assert_called_once()
 
 
-def test_show_plate_falls_through_to_trimesh():
-    mesh = trimesh.creation.box(extents=[10, 10, 10])
+@pytest.mark.parametrize(
+    ("ocp_shown", "trimesh_called"),
+    [(False, True), (True, False)],
+    ids=["falls_through_to_trimesh", "ocp_success_skips_trimesh"],
+)
+def test_show_plate_dispatch(ocp_shown, trimesh_called):
     with (
-        patch("fabprint.viewer._try_ocp", return_value=False) as mock_ocp,
+        patch("fabprint.viewer._try_ocp", return_value=ocp_shown) as mock_ocp,
         patch("fabprint.viewer._try_trimesh") as mock_trimesh,
     ):
-        show_plate([mesh], ["cube"], (256, 256))
+        show_plate([CUBE], ["cube"], (256, 256))
         mock_ocp.assert_called_once()
-        mock_trimesh.assert_called_once()
+        assert mock_trimesh.called is trimesh_called
 
 
-def test_show_plate_ocp_success_skips_trimesh():
-    mesh = trimesh.creation.box(extents=[10, 10, 10])
-    with (
-        patch("fabprint.viewer._try_ocp", return_value=True) as mock_ocp,
-        patch("fabprint.viewer._try_trimesh") as mock_trimesh,
-    ):
-        show_plate([mesh], ["cube"], (256, 256))
-        mock_ocp.assert_called_once()
-        mock_trimesh.assert_not_called()
+def test_try_ocp_exports_each_mesh_once(monkeypatch):
+    imported: list[tuple[str, int]] = []
+
+    def _import_stl(path):
+        imported.append((Path(path).name, len(trimesh.load(path).faces)))
+        return path
+
+    build123d = MagicMock(import_stl=_import_stl)
+    ocp_vscode = MagicMock()
+    monkeypatch.setitem(sys.modules, "build123d", build123d)
+    monkeypatch.setitem(sys.modules, "ocp_vscode", ocp_vscode)
+    _ocp_modules.cache_clear()
+
+    meshes = [CUBE, trimesh.creation.icosphere()]
+    assert _try_ocp(meshes, None, (256, 256)) is True
+
+    assert imported == [("part_0.stl", 12), ("part_1.stl", len(meshes[1].faces))]
+    # Temp STLs are cleaned up with their directory
+    assert not any(Path(p).exists() for p in ocp_vscode.show.call_args.args[:2])
+    _ocp_modules.cache_clear()
+
+
+def test_write_stl_matches_trimesh_export(tmp_path):
+    mesh = trimesh.creation.icosphere(subdivisions=2)
+    path = tmp_path / "ours.stl"
+    _write_stl(mesh, str(path))
+
+    assert path.read_bytes() == trimesh.exchange.stl.export_stl(mesh)
+
+
+def test_try_ocp_missing_modules_checked_once(monkeypatch):
+    monkeypatch.setitem(sys.modules, "build123d", None)  # import raises ImportError
+    _ocp_modules.cache_clear()
+
+    assert _try_ocp([CUBE], None, (256, 256)) is False
+    assert _try_ocp([CUBE], None, (256, 256)) is False
+    assert _ocp_modules.cache_info().misses == 1
+    _ocp_modules.cache_clear()